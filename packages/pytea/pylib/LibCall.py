@@ -10,6 +10,13 @@
 """
 
 import builtins as built
+import random
+import sys
+from types import SimpleNamespace
+
+_randint = random.randint
+_random = random.random
+_sys_exit = sys.exit
 
 
 def DEBUG(value):
@@ -21,110 +28,108 @@ def objectClass():
 
 
 class builtins:
+    isinstance = staticmethod(built.isinstance)
+    toInt = staticmethod(built.int)
+    toFloat = staticmethod(built.float)
+    len = staticmethod(built.len)
+
     @staticmethod
-    def isinstance(value, type):
-        return built.isinstance(value, type)
+    def randInt(lo, hi, prefix):
+        return _randint(lo, hi)
 
     @staticmethod
-    def toInt(value):
-        return int(value)
+    def randInts(*args):
+        return tuple(_randint(args[i], args[i + 1]) for i in range(0, len(args), 3))
 
     @staticmethod
-    def toFloat(value):
-        return float(value)
+    def randFloat(lo, hi, prefix):
+        return _random() * (hi - lo) + lo
 
     @staticmethod
-    def len(value):
-        return len(value)
+    def exit():
+        _sys_exit(-1)
 
     @staticmethod
-    def randInt(lo, hi, prefix):
-        import random
+    def warn(msg):
+        return NotImplementedError(msg)
 
-        return random.randint(lo, hi)
 
-    @staticmethod
-    def randFloat(lo, hi, prefix):
-        import random
+def _torch_tensorInit(self, args, kwargs):
+    pass
 
-        return random.random() * (hi - lo) + lo
 
-    @staticmethod
-    def exit():
-        import sys
+def _torch_broadcast(self, other):
+    pass
 
-        sys.exit(-1)
 
-    @staticmethod
-    def warn(msg):
-        return NotImplementedError(msg)
+def _torch_repeat(self, sizes):
+    pass
 
 
-class TorchLibCallImpl:
-    @staticmethod
-    def tensorInit(self, args, kwargs):
-        pass
+def _torch_matmul(self, other):
+    pass
 
-    @staticmethod
-    def broadcast(self, other):
-        pass
 
-    @staticmethod
-    def repeat(self, sizes):
-        pass
+def _torch_mul(self, other):
+    pass
 
-    @staticmethod
-    def matmul(self, other):
-        pass
 
-    @staticmethod
-    def mul(self, other):
-        pass
+def _torch_normal_(self, args, kwargs):
+    pass
 
-    @staticmethod
-    def normal_(self, args, kwargs):
-        pass
 
-    @staticmethod
-    def item(self):
-        pass
+def _torch_item(self):
+    pass
 
-    @staticmethod
-    def callTensor(dims):
-        pass
 
-    @staticmethod
-    def copyOut(tensor, out):
-        pass
+def _torch_callTensor(dims):
+    pass
 
-    @staticmethod
-    def transpose(tensor, dim0, dim1):
-        pass
 
-    @staticmethod
-    def identityShape(tensor, args, kwargs):
-        pass
+def _torch_copyOut(tensor, out):
+    pass
 
-    @staticmethod
-    def flatten(tensor, start_dim=0, end_dim=-1):
-        pass
 
-    @staticmethod
-    def embedding(tensor, weight):
-        pass
+def _torch_transpose(tensor, dim0, dim1):
+    pass
 
-    @staticmethod
-    def layer_norm(tensor, norm_tensor, weight, bias):
-        pass
 
+def _torch_identityShape(tensor, args, kwargs):
+    pass
 
-torch = TorchLibCallImpl()
 
+def _torch_flatten(tensor, start_dim=0, end_dim=-1):
+    pass
 
-class ArgparseImpl:
-    @staticmethod
-    def inject_argument(parsed, args, kwargs):
-        pass
+
+def _torch_embedding(tensor, weight):
+    pass
+
+
+def _torch_layer_norm(tensor, norm_tensor, weight, bias):
+    pass
+
+
+torch = SimpleNamespace(
+    tensorInit=_torch_tensorInit,
+    broadcast=_torch_broadcast,
+    repeat=_torch_repeat,
+    matmul=_torch_matmul,
+    mul=_torch_mul,
+    normal_=_torch_normal_,
+    item=_torch_item,
+    callTensor=_torch_callTensor,
+    copyOut=_torch_copyOut,
+    transpose=_torch_transpose,
+    identityShape=_torch_identityShape,
+    flatten=_torch_flatten,
+    embedding=_torch_embedding,
+    layer_norm=_torch_layer_norm,
+)
+
+
+def _argparse_inject_argument(parsed, args, kwargs):
+    pass
 
 
-argparse = ArgparseImpl()
+argparse = SimpleNamespace(inject_argument=_argparse_inject_argument)
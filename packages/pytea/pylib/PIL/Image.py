@@ -1,16 +1,20 @@
 import LibCall
-import random
 import numpy as np
 
+# number of channels of each image mode. other modes are regarded as 3-channel images.
+_MODE_CHANNEL = {
+    "1": 1,
+    "L": 1,
+    "P": 1,
+    "I": 1,
+    "F": 1,
+    "RGBA": 4,
+    "CMYK": 4,
+}
 
-class Image:
-    def __init__(self):
-        self._channel = 1
-        self.size = (0, 0)
-        self.height = 0
-        self.width = 0
 
-    def _setSize(self, channel, width, height):
+class Image:
+    def __init__(self, channel=1, width=0, height=0):
         self._channel = channel
         self.width = width
         self.height = height
@@ -21,68 +25,36 @@ class Image:
         return LibCall.PIL.getChannel(self)
 
     def copy(self):
-        im = Image()
-        im._setSize(self._getChannel(), self.width, self.height)
-        return im
+        # shallow clone; the new image shares its immutable symbolic shape and attributes.
+        return LibCall.builtins.clone(self)
 
     def convert(self, mode=None, *args, **kwargs):
         if mode is None:
             return self
-        elif len(mode) == 1:
-            im = Image()
-            im._setSize(1, self.width, self.height)
-            return im
-        elif mode == "RGBA" or mode == "CMYK":
-            im = Image()
-            im._setSize(4, self.width, self.height)
-            return im
-        else:
-            im = Image()
-            im._setSize(3, self.width, self.height)
-            return im
+
+        return Image(_MODE_CHANNEL.get(mode, 3), self.width, self.height)
 
     def transform(self, size, method, data=None, resample=0, fill=1, fillcolor=None):
         if (
-            method is not EXTENT
-            and method is not AFFINE
-            and method is not PERSPECTIVE
-            and method is not QUAD
-            and method is not MESH
+            method not in _TRANSFORM_METHODS
             and not isinstance(method, ImageTransformHandler)
-            and not hasattr(method, "getdata")
+            and getattr(method, "getdata", None) is None
         ):
             raise Exception("unknown method type")
 
-        im = Image()
-        im._setSize(self._getChannel(), size[0], size[1])
-        return im
+        return Image(self._getChannel(), size[0], size[1])
 
     def resize(self, size, resample=3, box=None, reducing_gap=None):
-        im = Image()
-        im._setSize(im._channel, size[0], size[1])
-        return im
+        return Image(self._getChannel(), size[0], size[1])
 
     def split(self, channel):
-        ret_val = [self.convert("L")]
-        for _ in range(1, self._channel):
-            ret_val.append(self.convert("L"))
-
-        return tuple(ret_val)
+        # every band is a fresh single-channel image of the same size.
+        width, height = self.width, self.height
+        return tuple(Image(1, width, height) for _ in range(self._channel))
 
 
 def new(mode, size, color=0):
-    if len(mode) == 1:
-        im = Image()
-        im._setSize(1, size[0], size[1])
-        return im
-    elif mode == "RGBA" or mode == "CMYK":
-        im = Image()
-        im._setSize(4, size[0], size[1])
-        return im
-    else:
-        im = Image()
-        im._setSize(3, size[0], size[1])
-        return im
+    return Image(_MODE_CHANNEL.get(mode, 3), size[0], size[1])
 
 
 class ImageTransformHandler:
@@ -91,20 +63,16 @@ class ImageTransformHandler:
 
 def open(fp, mode="r"):
     # TODO: image size range and target range settings in pyteaconfig.json
-    im = Image()
     # make symbolic image
-    im._setSize(
-        LibCall.builtins.randInt(1, 4, "PILImgC"),
-        LibCall.builtins.randInt(24, 4096, "PILImgW"),
-        LibCall.builtins.randInt(24, 4096, "PILImgH"),
+    channel, width, height = LibCall.builtins.randInts(
+        1, 4, "PILImgC", 24, 4096, "PILImgW", 24, 4096, "PILImgH"
     )
-    return im
+    return Image(channel, width, height)
 
 
 def blend(im1, im2, alpha):
     LibCall.PIL.blend(im1, im2, alpha)  # just adds constraints, doesn't return obj.
-    im = im1.copy()
-    return im
+    return im1.copy()
 
 
 def fromarray(obj, mode=None):
@@ -132,3 +100,5 @@ EXTENT = 1
 PERSPECTIVE = 2
 QUAD = 3
 MESH = 4
+
+_TRANSFORM_METHODS = (AFFINE, EXTENT, PERSPECTIVE, QUAD, MESH)
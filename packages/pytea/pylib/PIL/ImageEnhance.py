@@ -1,5 +1,4 @@
 import LibCall
-from . import Image
 
 
 class _Enhance:
@@ -9,8 +9,7 @@ def autocontrast(image, cutoff=0, ignore=None, mask=None):
 def colorize(image, block, white, mid=None, blockpoint=0, whitepoint=255, midpoint=127):
     if image.mode is not "L":
         raise Exception("mode must be \"L\"")
-    im = Image.Image()
-    im._setSize(3, image.width, image.height)
+    im = Image.Image(3, image.width, image.height)
     im.mode = "RGB"
     return im
 
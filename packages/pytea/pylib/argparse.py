@@ -6,15 +6,17 @@ class Namespace:
         pass
 
 
+def _ignore_argument(*args, **kwargs):
+    pass
+
+
 class ArgumentParser:
     def __init__(self, *args, **kwargs):
         self.parsed = Namespace()
         self._subcommand = None
-        self._valid = True
 
     def add_argument(self, *args, **kwargs):
-        if self._valid:
-            LibCall.argparse.inject_argument(self.parsed, args, kwargs)
+        LibCall.argparse.inject_argument(self.parsed, args, kwargs)
 
     def parse_args(self, *args, **kwargs):
         # TODO: parse explicit argument.
@@ -29,6 +31,7 @@ class ArgumentParser:
         if self._subcommand == name:
             return self
         else:
+            # arguments of unselected subcommands are never injected.
             dummy = ArgumentParser()
-            dummy._valid = False
+            dummy.add_argument = _ignore_argument
             return dummy
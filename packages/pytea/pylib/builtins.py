@@ -36,26 +36,35 @@ def exit(code=0):
 def max(*args):
     if len(args) == 0:
         raise ValueError("max() arg is an empty sequence")
-    elif len(args) == 1:
-        return max(*args[0])
 
-    value = args[0]
-    for v in args[1:]:
-        if value < v:
+    # max(iterable) iterates it directly instead of unpacking it into a new args tuple.
+    values = args[0] if len(args) == 1 else args
+    first = True
+    for v in values:
+        if first:
             value = v
+            first = False
+        elif value < v:
+            value = v
+    if first:
+        raise ValueError("max() arg is an empty sequence")
     return value
 
 
 def min(*args):
     if len(args) == 0:
         raise ValueError("min() arg is an empty sequence")
-    elif len(args) == 1:
-        return max(*args[0])
 
-    value = args[0]
-    for v in args[1:]:
-        if value > v:
+    values = args[0] if len(args) == 1 else args
+    first = True
+    for v in values:
+        if first:
+            value = v
+            first = False
+        elif value > v:
             value = v
+    if first:
+        raise ValueError("min() arg is an empty sequence")
     return value
 
 
@@ -85,7 +94,12 @@ class range:
             else:
                 self.step = step
 
-        self._len = (self.stop - self.start) // self.step
+        # ceiling division towards the step direction. empty range has zero length.
+        diff = self.stop - self.start
+        if self.step > 0:
+            self._len = LibCall.math.clamp_nonneg((diff + self.step - 1) // self.step)
+        else:
+            self._len = LibCall.math.clamp_nonneg((diff + self.step + 1) // self.step)
 
     def __len__(self):
         return self._len
@@ -95,76 +109,60 @@ class range:
 
 
 class __Primitives:
-    def __init__(self, type):
+    def __init__(self, type, name):
         self.type = type
+        self.__name__ = name
+        self.__mro__ = (self, object)
 
     def __call__(self, value=None, **kwargs):
         return LibCall.builtins.cast(value, self.type, kwargs)
 
 
-int = __Primitives(0)
-int.__mro__ = (int, object)
-int.__name__ = "int"
-float = __Primitives(1)
-float.__mro__ = (float, object)
-float.__name__ = "float"
-str = __Primitives(2)
-str.__mro__ = (str, object)
-str.__name__ = "str"
-bool = __Primitives(3)
-bool.__mro__ = (bool, object)
-bool.__name__ = "bool"
-tuple = __Primitives(4)
-tuple.__mro__ = (tuple, object)
-tuple.__name__ = "tuple"
-list = __Primitives(5)
-list.__mro__ = (list, object)
-list.__name__ = "list"
-dict = __Primitives(6)
-dict.__mro__ = (dict, object)
-dict.__name__ = "dict"
-set = __Primitives(7)
-set.__mro__ = (set, object)
-set.__name__ = "set"
-Ellipsis = __Primitives(8)
-Ellipsis.__mro__ = (Ellipsis, object)
-Ellipsis.__name__ = "Ellipsis"
+int = __Primitives(0, "int")
+float = __Primitives(1, "float")
+str = __Primitives(2, "str")
+bool = __Primitives(3, "bool")
+tuple = __Primitives(4, "tuple")
+list = __Primitives(5, "list")
+dict = __Primitives(6, "dict")
+set = __Primitives(7, "set")
+Ellipsis = __Primitives(8, "Ellipsis")
+
+
+# resolve omitted and negative slice bounds like slice.indices.
+# with a negative step, an omitted stop is -1 (before index 0) and is not normalized.
+def _sliceBounds(index, length):
+    step = 1 if index.step is None else index.step
+    if step == 0:
+        raise ValueError("slice step cannot be zero")
+
+    if index.start is None:
+        start = 0 if step > 0 else length - 1
+    elif index.start >= 0:
+        start = index.start
+    else:
+        start = length + index.start
+
+    if index.stop is None:
+        stop = length if step > 0 else -1
+    elif index.stop >= 0:
+        stop = index.stop
+    else:
+        stop = length + index.stop
+
+    return start, stop, step
 
 
 def _tuple__getitem__(self, index):
     if isinstance(index, int):
         return LibCall.builtins.getItemByIndex(self, index)
     elif isinstance(index, slice):
-        start, stop = None, None
-        self_len = len(self)
-        if index.start is not None:
-            if index.start >= 0:
-                start = index.start
-            else:
-                start = self_len + index.start
-        else:
-            start = 0
-
-        if index.stop is not None:
-            if index.stop >= 0:
-                stop = index.stop
-            else:
-                stop = self_len + index.stop
-
-        if index.start is None:
-            if index.stop is None:
-                # index by [:]
-                return tuple(self[i] for i in range(0, self_len))
-            else:
-                # index by [:stop]
-                return tuple(self[i] for i in range(0, stop))
-        else:
-            if index.stop is None:
-                # index by [start:]
-                return tuple(self[i] for i in range(start, self_len))
-            else:
-                # index by [start:stop]
-                return tuple(self[i] for i in range(start, stop))
+        start, stop, step = _sliceBounds(index, len(self))
+        sliced = LibCall.builtins.sliceRange(self, start, stop, step)
+        if sliced is None:
+            # symbolic bounds: collect the items one by one.
+            return tuple(self[i] for i in range(start, stop, step))
+        return sliced
 
 
 tuple.__getitem__ = _tuple__getitem__
@@ -178,32 +176,35 @@ list.append = _list_append
 
 
 class proxy_list(list):
-    def __init__(self, base, offset, length):
+    def __init__(self, base, offset, length, step=1):
         super().__init__()
         self.base = LibCall.builtins.clone(base)
         self.offset = offset
+        self.step = step
         LibCall.builtins.setAttr(self, "$length", length)
 
     def __setitem__(self, key, value):
-        self.base[key + self.offset] = value
+        self.base[self.offset + key * self.step] = value
 
     def __getitem__(self, index):
         if isinstance(index, int):
-            return self.base[index + self.offset]
+            return self.base[self.offset + index * self.step]
         elif isinstance(index, slice):
-            start, stop = None, None
-            self_len = len(self)
             if index.start is not None:
                 start = index.start
             else:
                 start = 0
 
+            # length is only required for the open end.
             if index.stop is not None:
                 stop = index.stop
             else:
-                stop = self_len
+                stop = len(self)
 
-            return self.base[slice(start + self.offset, stop + self.offset, index.step)]
+            step = self.step if index.step is None else index.step * self.step
+            return self.base[
+                slice(self.offset + start * self.step, self.offset + stop * self.step, step)
+            ]
         else:
             # TODO: filter SVWarning
             raise IndexError("index is not an integer or slice")
@@ -213,43 +214,18 @@ def _list__getitem__(self, index):
     if isinstance(index, int):
         return LibCall.builtins.getItemByIndex(self, index)
     elif isinstance(index, slice):
-        start, stop = None, None
-        self_len = len(self)
-        if index.start is not None:
-            if index.start >= 0:
-                start = index.start
-            else:
-                start = self_len + index.start
-        else:
-            start = 0
-
-        if index.stop is not None:
-            if index.stop >= 0:
-                stop = index.stop
-            else:
-                stop = self_len + index.stop
-        else:
-            stop = self_len
+        start, stop, step = _sliceBounds(index, len(self))
 
         # TODO: if stop/start out of bound?
         # Bypass big slicing
-        if stop - start >= 50:
-            return proxy_list(self, start, stop - start)
-
-        if index.start is None:
-            if index.stop is None:
-                # index by [:]
-                return list(self[i] for i in range(0, self_len))
-            else:
-                # index by [:stop]
-                return list(self[i] for i in range(0, stop))
-        else:
-            if index.stop is None:
-                # index by [start:]
-                return list(self[i] for i in range(start, self_len))
-            else:
-                # index by [start:stop]
-                return list(self[i] for i in range(start, stop))
+        if step > 0 and stop - start >= 50:
+            return proxy_list(self, start, (stop - start + step - 1) // step, step)
+
+        sliced = LibCall.builtins.sliceRange(self, start, stop, step)
+        if sliced is None:
+            # symbolic bounds: collect the items one by one.
+            return list(self[i] for i in range(start, stop, step))
+        return sliced
     else:
         # TODO: filter SVWarning
         raise IndexError("index is not an integer or slice")
@@ -267,6 +243,11 @@ list.__setitem__ = _list__setitem__
 
 
 def _list__contains__(self, value):
+    found = LibCall.builtins.list_contains(self, value)
+    if found is not None:
+        return found
+
+    # some items cannot be compared statically. compare them by __eq__.
     for item in self:
         if item == value:
             return True
@@ -277,6 +258,11 @@ list.__contains__ = _list__contains__
 
 
 def _list__add__(self, items):
+    ret = LibCall.builtins.concat(self, items)
+    if ret is not None:
+        return ret
+
+    # some items cannot be fetched
     ret = []
     for item in self:
         LibCall.builtins.list_append(ret, item)
@@ -289,40 +275,50 @@ list.__add__ = _list__add__
 
 
 def _list_index(self, x, start=None, end=None):
-    if start is not None or end is not None:
-        if start is None:
-            sliced = self[:end]
-            start = 0
-        elif end is None:
-            sliced = self[start:]
-        else:
-            sliced = self[start:end]
-
-        for i, value in enumerate(sliced):
-            if value == x:
-                return i + start
-    else:
-        for i, value in enumerate(self):
-            if value == x:
+    self_len = len(self)
+    if start is None:
+        start = 0
+    elif start < 0:
+        start = max(self_len + start, 0)
+
+    if end is None or end > self_len:
+        end = self_len
+    elif end < 0:
+        end = self_len + end
+
+    index = LibCall.builtins.list_index(self, x, start, end)
+    if index is None:
+        # some items cannot be compared statically. compare them by __eq__.
+        for i in range(start, end):
+            if self[i] == x:
                 return i
+    elif index >= 0:
+        return index
 
     # TODO: ignore it?
     raise ValueError("value is not in list")
 
 
 list.index = _list_index
+tuple.index = _list_index
 
 
 def _tuple__add__(self, items):
-    ret = ()
+    ret = LibCall.builtins.concat(self, items)
+    if ret is not None:
+        return ret
+
+    # some items cannot be fetched. build a list and convert it once; tuples are immutable.
+    ret = []
     for item in self:
         LibCall.builtins.list_append(ret, item)
     for item in items:
         LibCall.builtins.list_append(ret, item)
-    return ret
+    return tuple(ret)
 
 
 tuple.__add__ = _tuple__add__
+tuple.__contains__ = _list__contains__
 
 
 def _dict_keys(self):
@@ -374,33 +370,44 @@ def _dict_pop(self, key, defaultVal):
 dict.pop = _dict_pop
 
 
+def _dict_get(self, key, default=None):
+    if LibCall.builtins.has_key(self, key):
+        return LibCall.builtins.dict_getitem(self, key)
+    return default
+
+
+dict.get = _dict_get
+
+
 def _dict_update(self, other, **kwargs):
-    for (key, value) in other.items():
-        self[key] = value
-    for (key, value) in kwargs.items():
-        self[key] = value
+    if isinstance(other, dict):
+        LibCall.builtins.dict_merge(self, other)
+    else:
+        for (key, value) in other.items():
+            self[key] = value
+    LibCall.builtins.dict_merge(self, kwargs)
 
 
 dict.update = _dict_update
 
 
 class _dict_keyiterator:
+    # cursor over the keys of the dict. keys are not copied.
     def __init__(self, d):
         self.d = d
-        self.keys = list(d.keys())
         self.idx = 0
-        self.len = len(self.keys)
+        self.len = LibCall.builtins.dict_size(d)
 
     def __next__(self):
         if self.idx < self.len:
-            key = self.keys[self.idx]
+            key = LibCall.builtins.dict_key_at(self.d, self.idx)
             self.idx += 1
             return key
         else:
             raise StopIteration
 
     def __getitem__(self, i):
-        return self.keys[i]
+        return LibCall.builtins.dict_key_at(self.d, i)
 
     def __len__(self):
         return self.len
@@ -443,13 +450,9 @@ str.endswith = _str_endswith
 
 
 def _str_join(self, iterable):
-    s_first = ""
-    s_next = s_first
-    for i in iterable:
-        s_first = s_next
-        s_first = s_first + str(i)
-        s_next = s_first + self
-    return s_first
+    if isinstance(iterable, (list, tuple)):
+        return LibCall.builtins.str_join(self, iterable)
+    return LibCall.builtins.str_join(self, [i for i in iterable])
 
 
 str.join = _str_join
@@ -472,6 +475,11 @@ str.ljust = _str_ljust
 
 
 def sum(values):
+    a = LibCall.math.sum(values)
+    if a is not None:
+        return a
+
+    # non-numeric items (e.g. tensors) are added by __add__
     a = 0
     for i in values:
         a += i
@@ -482,37 +490,32 @@ class map:
     def __init__(self, f, iterable):
         self.f = f
         self.iterable = iterable
+        self.len = len(iterable)
 
     def __getitem__(self, index):
         return self.f(self.iterable[index])
 
     def __len__(self):
-        return len(self.iterable)
+        return self.len
 
 
 class enumerate:
     def __init__(self, iterable, start=0):
         self.iterable = iterable
         self.start = start
+        self.len = len(iterable)
 
     def __getitem__(self, index):
         return (self.start + index, self.iterable[index])
 
     def __len__(self):
-        return len(self.iterable)
+        return self.len
 
 
 class zip:
     def __init__(self, *args):
         self.args = args
-        self.len = 0
-
-        found = True
-        for l in args:
-            len_l = len(l)
-            if found or len_l < self.len:
-                self.len = len_l
-                found = False
+        self.len = min([len(l) for l in args]) if len(args) > 0 else 0
 
     def __getitem__(self, index):
         value = []
@@ -525,14 +528,61 @@ class zip:
         return self.len
 
 
+class _index_iterator:
+    # cursor over an indexable value. does not copy the value.
+    def __init__(self, value):
+        self.value = value
+        self.idx = 0
+        self.len = len(value)
+
+    def __next__(self):
+        if self.idx < self.len:
+            item = self.value[self.idx]
+            self.idx += 1
+            return item
+        else:
+            raise StopIteration
+
+    def __getitem__(self, i):
+        return self.value[i]
+
+    def __len__(self):
+        return self.len
+
+
 def iter(value):
-    return value.__iter__()
+    # list, tuple and other sequences do not have __iter__; iterate them by index.
+    # classes with __getattr__ (e.g. Tensor) answer NotImplemented for a missing __iter__.
+    method = getattr(value, "__iter__", None)
+    if method is None or method is NotImplemented:
+        return _index_iterator(value)
+    return method()
+
+
+def next(iterator, *default):
+    # the index iterator knows its length, so exhaustion is checked before __next__.
+    # other iterators signal it only by raising StopIteration.
+    if len(default) > 0 and isinstance(iterator, _index_iterator):
+        if iterator.idx >= iterator.len:
+            return default[0]
+    return iterator.__next__()
 
 
 def callable(value):
     return LibCall.builtins.callable(value)
 
 
+def getattr(object, name, *default):
+    # single lookup; returns default on miss instead of probing twice.
+    if len(default) == 0:
+        return LibCall.builtins.getAttr(object, name)
+    return LibCall.builtins.getAttr(object, name, default[0])
+
+
+def hasattr(object, name):
+    return LibCall.builtins.hasAttr(object, name)
+
+
 def sorted(values):
     # TODO: do sort
     return values
@@ -1,5 +1,8 @@
 import LibCall
 
+# constructed namedtuple classes by "typename field1 field2 ..."
+_namedtupleCache = dict()
+
 
 def namedtuple(typename, field_names, **kwargs):
     names = field_names
@@ -7,22 +10,24 @@ def namedtuple(typename, field_names, **kwargs):
         names = []
         LibCall.builtins.namedtuple_pushField(names, field_names)
 
-    rev_names = dict()
-    for i, name in enumerate(names):
-        rev_names[name] = i
+    cacheKey = typename + " " + " ".join(names)
+    if cacheKey in _namedtupleCache:
+        return _namedtupleCache[cacheKey]
+
+    num_fields = len(names)
 
     class __TempTuple(tuple):
         def __init__(self, *args, **kwargs):
-            for i, value in enumerate(args):
-                LibCall.builtins.setIndice(self, i, value)
-                LibCall.builtins.setAttr(self, names[i], value)
+            LibCall.builtins.namedtuple_setFields(self, names, args)
+            # field index is looked up only for keyword arguments.
             for key, value in kwargs.items():
-                LibCall.builtins.setIndice(self, rev_names[key], value)
+                LibCall.builtins.setIndice(self, names.index(key), value)
                 LibCall.builtins.setAttr(self, key, value)
 
         def __len__(self):
-            return len(names)
+            return num_fields
 
     __TempTuple.__name__ = typename
+    _namedtupleCache[cacheKey] = __TempTuple
 
     return __TempTuple
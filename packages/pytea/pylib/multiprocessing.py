@@ -14,7 +14,13 @@ class Process:
         self.daemon = daemon
 
     def start(self):
-        self.target(*self.args, **self.kwargs)
+        args = self.args
+        kwargs = self.kwargs
+        # most processes have no keyword arguments. skip unpacking an empty dict.
+        if len(kwargs) == 0:
+            self.target(*args)
+        else:
+            self.target(*args, **kwargs)
 
     def join(self):
         pass
@@ -49,8 +49,8 @@ short = int16
 int = int32
 long = int64
 
-floatTypes = [float64, float32, float16]
-intTypes = [int64, int32, int16, int8, uint8]
+floatTypes = (float64, float32, float16)
+intTypes = (int64, int32, int16, int8, uint8)
 
 floatDefault = float32
 intDefault = int64
@@ -59,36 +59,29 @@ def maxDtype(*objs):
     maxPrecedence = -1
     dtype = None
     for obj in objs:
-        if isinstance(obj, np.ndarray):    
-            if tensor.dtype.precedence > maxPrecedence:
-                maxPrecedence = tensor.dtype.precedence
-                dtype = tensor.dtype
-        elif isinstance(obj, np.dtype):
-            if obj.precedence > maxPrecedence:
-                maxPrecedence = obj.precedence
-                dtype = obj
+        if isinstance(obj, np.ndarray):
+            obj = obj.dtype
+        elif not isinstance(obj, np.dtype):
+            continue
+        if obj.precedence > maxPrecedence:
+            maxPrecedence = obj.precedence
+            dtype = obj
     return dtype
 
+# numpy dtypes indexed by precedence. torch dtypes share the same precedences.
+_dtypeByPrecedence = (
+    bool,
+    uint8,
+    int8,
+    int16,
+    int32,
+    int64,
+    float16,
+    float32,
+    float64,
+    complex64,
+    complex128,
+)
+
 def toNpdtype(torchDtype):
-    if torchDtype is torch.complex128:
-        return complex128
-    elif torchDtype is torch.complex64:
-        return complex64
-    elif torchDtype is torch.float64:
-        return float64
-    elif torchDtype is torch.float32:
-        return float32
-    elif torchDtype is torch.float16:
-        return float16
-    elif torchDtype is torch.int64:
-        return int64
-    elif torchDtype is torch.int32:
-        return int32
-    elif torchDtype is torch.int16:
-        return int16
-    elif torchDtype is torch.int8:
-        return int8
-    elif torchDtype is torch.uint8:
-        return uint8
-    elif torchDtype is torch.bool:
-        return bool
\ No newline at end of file
+    return _dtypeByPrecedence[torchDtype.precedence]
@@ -10,7 +10,7 @@ from PIL import Image
 def array(obj, dtype=None, **kwargs):
     if isinstance(obj, torch.Tensor):
         arr = ndarray(obj.shape)
-    if isinstance(obj, Image.Image):
+    elif isinstance(obj, Image.Image):
         arr = ndarray(())
         LibCall.numpy.fromImage(arr, obj)
     else:
@@ -20,37 +20,58 @@ def array(obj, dtype=None, **kwargs):
 
 
 def _parseDtype(obj):
-    if isinstance(obj, ndarray):
+    # scalar elements of nested sequences are the most common input. test them first.
+    if isinstance(obj, int):
+        return np.intDefault
+    elif isinstance(obj, float):
+        return np.floatDefault
+    elif isinstance(obj, (list, tuple)):
+        return _parseSequenceDtype(obj)
+    elif isinstance(obj, ndarray):
         return obj.dtype
-    if isinstance(obj, torch.Tensor):
+    elif isinstance(obj, torch.Tensor):
         return np.toNpdtype(obj.dtype)
-    if isinstance(obj, Image.Image):
+    elif isinstance(obj, Image.Image):
         # TODO: dtype
         return np.floatDefault
-    if isinstance(obj, float):
-        return np.floatDefault
-    elif isinstance(obj, int):
-        return np.intDefault
-
-    if isinstance(obj, tuple) or isinstance(obj, list):
-        dtypes = []
-        for elem in obj:
-            dtypes.append(_parseDtype(elem))
-        return np.maxDtype(*dtypes)
 
     LibCall.builtins.warn("cannot infer dtype. fallback to float")
     return np.floatDefault
 
 
+def _parseSequenceDtype(seq):
+    # walk nested sequences level by level instead of recursing once per element.
+    # scalars only set flags; they are merged into dtype once at the end.
+    dtype = None
+    hasInt = False
+    hasFloat = False
+    items = seq
+    while len(items) > 0:
+        nested = []
+        for item in items:
+            if isinstance(item, int):
+                hasInt = True
+            elif isinstance(item, float):
+                hasFloat = True
+            elif isinstance(item, (list, tuple)):
+                for elem in item:
+                    nested.append(elem)
+            else:
+                dtype = np.maxDtype(dtype, _parseDtype(item))
+        items = nested
+
+    if hasInt:
+        dtype = np.maxDtype(dtype, np.intDefault)
+    if hasFloat:
+        dtype = np.maxDtype(dtype, np.floatDefault)
+    return dtype
+
+
 def zeros(shape, dtype=float, order="C"):
-    if isinstance(shape, int):
-        shape = [shape]
     return ndarray(shape, dtype=dtype, order=order)
 
 
 def empty(shape, dtype=float, order="C"):
-    if isinstance(shape, int):
-        shape = [shape]
     return ndarray(shape, dtype=dtype, order=order)
 
 
@@ -70,19 +91,11 @@ def matmul(x1, x2, out=None, casting="same_kind", order="K", dtype=None, subok=T
         x1 = array(x1)
     if not isinstance(x2, ndarray):
         x2 = array(x2)
-    dtype = x1.dtype
-    arr = LibCall.numpy.matmul(x1, x2)
-    arr.dtype = dtype
-    LibCall.numpy.copyOut(arr, out)
-    return arr
+    return LibCall.numpy.matmul(x1, x2, x1.dtype, out)
 
 
 def concatenate(seq, axis=0, out=None):
-    dtype = np.maxDtype(*seq)
-    arr = LibCall.numpy.concatenate(seq, axis)
-    arr.dtype = dtype
-    LibCall.numpy.copyOut(array, out)
-    return arr
+    return LibCall.numpy.concatenate(seq, axis, np.maxDtype(*seq), out)
 
 
 def sum(a, axis=None, dtype=None, out=None, keepdims=False, initial=None, where=True):
@@ -90,9 +103,8 @@ def sum(a, axis=None, dtype=None, out=None, keepdims=False, initial=None, where=
         a = array(a)
     if dtype is None:
         dtype = a.dtype
-    arr = LibCall.numpy.reduce(a, axis, keepdims)
+    arr = LibCall.numpy.reduce(a, axis, keepdims, out)
     arr.dtype = dtype
-    LibCall.numpy.copyOut(arr, out)
     return arr
 
 
@@ -107,10 +119,9 @@ def average(a, axis=None, weights=None, returned=False):
 
 def mean(a, axis=None, dtype=None, out=None, keepdims=False, where=None):
     # TODO: implement `where` option
-    if not isinstance(a):
+    if not isinstance(a, ndarray):
         a = array(a)
-    arr = LibCall.numpy.reduce(a, axis, keepdims)
-    LibCall.numpy.copyOut(arr, out)
+    arr = LibCall.numpy.reduce(a, axis, keepdims, out)
     return arr
 
 
@@ -118,9 +129,8 @@ def max(a, axis=None, out=None, keepdims=False, initial=None, where=True):
     if not isinstance(a, ndarray):
         a = array(a)
     dtype = a.dtype
-    arr = LibCall.numpy.reduce(a, axis, keepdims)
+    arr = LibCall.numpy.reduce(a, axis, keepdims, out)
     arr.dtype = dtype
-    LibCall.numpy.copyOut(arr, out)
     return arr
 
 
@@ -128,9 +138,8 @@ def min(a, axis=None, out=None, keepdims=False, initial=None, where=True):
     if not isinstance(a, ndarray):
         a = array(a)
     dtype = a.dtype
-    arr = LibCall.numpy.reduce(a, axis, keepdims)
+    arr = LibCall.numpy.reduce(a, axis, keepdims, out)
     arr.dtype = dtype
-    LibCall.numpy.copyOut(arr, out)
     return arr
 
 
@@ -139,9 +148,8 @@ def argmax(a, axis=None, out=None):
         a = array(a)
     if (axis is not None) and (not isinstance(axis, int)):  # tuple axis is not allowed
         raise TypeError("axis must be an int")
-    indexArray = LibCall.numpy.reduce(a, axis, False)
+    indexArray = LibCall.numpy.reduce(a, axis, False, out)
     indexArray.dtype = np.intDefault
-    LibCall.numpy.copyOut(indexArray, out)
     return indexArray
 
 
@@ -159,13 +167,10 @@ def _bop(array, other):
         arr.dtype = dtype
         return arr
     elif isinstance(other, float):
-        if (
-            (array.dtype is np.float64)
-            or (array.dtype is np.float32)
-            or (array.dtype is np.float16)
-        ):
-            dtype = array.dtype
-        else:
+        # float16, float32 and float64 occupy a contiguous precedence band.
+        dtype = array.dtype
+        precedence = dtype.precedence
+        if precedence < np.float16.precedence or precedence > np.float64.precedence:
             dtype = np.floatDefault
         arr = LibCall.numpy.identityShape(array)
         arr.dtype = dtype
@@ -2,6 +2,12 @@ import LibCall
 import numpy as np
 
 
+# uint8, int8, int16, int32 and int64 occupy a contiguous precedence band.
+def _isIntDtype(dtype):
+    precedence = dtype.precedence
+    return precedence >= np.uint8.precedence and precedence <= np.int64.precedence
+
+
 class ndarray:
     def __init__(
         self, shape, dtype=float, buffer=None, offset=0, strides=None, order=None
@@ -28,33 +34,30 @@ class ndarray:
         temp = self.shape
         dtype = self.dtype
 
-        if isinstance(index, tuple):
-            if isinstance(index[0], np.ndarray) and (
-                (index[0].dtype is np.int64)
-                or (index[0].dtype is np.int32)
-                or (index[0].dtype is np.int16)
-                or (index[0].dtype is np.int8)
-                or (index[0].dtype is np.uint8)
-            ):
-                arr = LibCall.numpy.indexIntarrays(temp, len(index), index)
+        # scalar int indexing is the most common case. skip the tuple and index array checks.
+        if isinstance(index, int):
+            if len(temp) <= 0:
+                raise IndexError(
+                    "invalid index of a 0-dim tensor. Use tensor.item() to convert a 0-dim tensor to a Python number"
+                )
+            arr = ndarray(LibCall.shape.tensorGetItem(temp, 0, index))
+            arr.dtype = dtype
+            return arr
+        elif isinstance(index, tuple):
+            idx_len = len(index)
+            first = index[0]
+            if isinstance(first, np.ndarray) and _isIntDtype(first.dtype):
+                arr = LibCall.numpy.indexIntarrays(temp, idx_len, index)
                 arr.dtype = dtype
                 return arr
 
-            idx_len = len(index)
-            if idx_len > len(self.shape):
+            if idx_len > len(temp):
                 raise IndexError("too many indices for tensor")
-            for axis in range(idx_len - 1, -1, -1):
-                temp = LibCall.shape.tensorGetItem(temp, axis, index[axis])
+            temp = LibCall.shape.tensorGetItems(temp, index)
             arr = ndarray(temp)
             arr.dtype = dtype
             return arr
-        elif isinstance(index, np.ndarray) and (
-            (index.dtype is np.int64)
-            or (index.dtype is np.int32)
-            or (index.dtype is np.int16)
-            or (index.dtype is np.int8)
-            or (index.dtype is np.uint8)
-        ):
+        elif isinstance(index, np.ndarray) and _isIntDtype(index.dtype):
             arr = LibCall.numpy.indexIntarrays(temp, 1, [index])
             arr.dtype = dtype
             return arr
@@ -76,47 +79,11 @@ class ndarray:
     def __add__(self, other):
         return np._bop(self, other)
 
-    def __radd__(self, other):
-        return np._bop(self, other)
-
-    def __sub__(self, other):
-        return np._bop(self, other)
-
-    def __rsub__(self, other):
-        return np._bop(self, other)
-
-    def __mul__(self, other):
-        return np._bop(self, other)
-
-    def __rmul__(self, other):
-        return np._bop(self, other)
-
-    def __truediv__(self, other):
-        return np._bop(self, other)
-
-    def __rtruediv__(self, other):
-        return np._bop(self, other)
-
-    def __floordiv__(self, other):
-        return np._bop(self, other)
-
-    def __rfloordiv__(self, other):
-        return np._bop(self, other)
-
-    def __eq__(self, other):
-        return np._bop(self, other)
-
     def __matmul__(self, other):
-        dtype = self.dtype
-        arr = LibCall.numpy.matmul(self, other)
-        arr.dtype = dtype
-        return arr
+        return LibCall.numpy.matmul(self, other, self.dtype)
 
     def __rmatmul__(self, other):
-        dtype = self.dtype
-        arr = LibCall.numpy.matmul(other, self)
-        arr.dtype = dtype
-        return arr
+        return LibCall.numpy.matmul(other, self, self.dtype)
 
     def sum(
         self, axis=None, dtype=None, out=None, keepdims=False, initial=None, where=True
@@ -146,10 +113,22 @@ class ndarray:
         elif dtype is bool:
             dtype = np.bool
 
-        if copy is True:
-            copied = np.copy(self, order=order, subok=subok)
-            copied.dtype = dtype
-            return copied
-
-        self.dtype = dtype
-        return self
+        # without copy, an array which already has the dtype is returned as is.
+        if copy is False and dtype is self.dtype:
+            return self
+
+        # the copy is created with its new dtype; np.copy would assign it twice.
+        return ndarray(self.shape, dtype=dtype, order=order)
+
+
+# every arithmetic dunder shares the same broadcasting function.
+ndarray.__radd__ = ndarray.__add__
+ndarray.__sub__ = ndarray.__add__
+ndarray.__rsub__ = ndarray.__add__
+ndarray.__mul__ = ndarray.__add__
+ndarray.__rmul__ = ndarray.__add__
+ndarray.__truediv__ = ndarray.__add__
+ndarray.__rtruediv__ = ndarray.__add__
+ndarray.__floordiv__ = ndarray.__add__
+ndarray.__rfloordiv__ = ndarray.__add__
+ndarray.__eq__ = ndarray.__add__
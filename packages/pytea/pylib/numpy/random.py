@@ -8,13 +8,15 @@ def seed(seed=None):
 
 
 def rand(*shape):
-    if isinstance(shape, int):
-        shape = [shape]
     return ndarray(shape, dtype=float, order=None)
 
 
 # random integer [low, high)
 def randint(low, high=None, size=None, dtype=int):
+    if size is not None:
+        # TODO: Set range of each dim
+        return ndarray(size, dtype=dtype, order=None)
+
     if high is None:
         a = 0
         b = low
@@ -22,10 +24,5 @@ def randint(low, high=None, size=None, dtype=int):
         a = low
         b = high
 
-    if size is None:
-        # range of randInt(a, b) = [a, b] (not [a, b))
-        return LibCall.builtins.randInt(a, b - 1, "np_randint")
-    if isinstance(size, int):
-        size = [size]
-    # TODO: Set range of each dim
-    return ndarray(size, dtype=dtype, order=None)
+    # range of randInt(a, b) = [a, b] (not [a, b))
+    return LibCall.builtins.randInt(a, b - 1, "np_randint")
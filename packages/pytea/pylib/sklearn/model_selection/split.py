@@ -13,7 +13,7 @@ class DataLabelList:
         return self._len
 
     def __getitem__(self, index):
-        if index < 0 or index >= self.__len__():
+        if index < 0 or index >= self._len:
             raise IndexError("Dataset out of bound")
 
         return self.baseDataset[index]
@@ -48,14 +48,16 @@ def train_test_split(*arrays, **options):
         return trainList, testList
 
     # when arrays = (data_batch, label_batch)
+    # every array has the same number of samples. split lengths are computed once.
+    n_samples = len(arrays[0])
+    test_length = int(test_size * n_samples)
+    train_length = n_samples - test_length
     for array in arrays:
-        test_length = int(test_size * len(array))
-        train_length = len(array) - test_length
+        if len(array) != n_samples:
+            raise ValueError("Found input variables with inconsistent numbers of samples")
 
-        train = LibCall.shape.repeat(array, 0, train_length)
-        train = LibCall.torch.reduce(train, 1, False)
-        test = LibCall.shape.repeat(array, 0, test_length)
-        test = LibCall.torch.reduce(test, 1, False)
+        train = LibCall.shape.setDim(array, 0, train_length)
+        test = LibCall.shape.setDim(array, 0, test_length)
 
         ret_arrays.append(train)
         ret_arrays.append(test)
@@ -1,4 +1,6 @@
-class no_grad:
+# gradient mode does not affect shapes.
+# every context manager and decorator shares one stateless object.
+class _GradMode:
     def __enter__(self):
         return None
 
@@ -6,16 +8,21 @@ class no_grad:
         return True
 
     def __call__(self, func):
-        return self
+        return func
 
 
-class enable_grad:
-    def __enter__(self):
-        return None
+_noGrad = _GradMode()
+_enableGrad = _GradMode()
 
-    def __exit__(self, *args):
-        return True
 
-    def __call__(self, func):
-        return self
+# bare decorator form (@torch.no_grad) receives the function; return it unchanged.
+def no_grad(func=None):
+    if func is None:
+        return _noGrad
+    return func
+
 
+def enable_grad(func=None):
+    if func is None:
+        return _enableGrad
+    return func
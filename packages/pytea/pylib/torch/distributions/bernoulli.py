@@ -6,10 +6,10 @@ from .distribution import Distribution
 class Bernoulli(Distribution):
     def __init__(self, probs=None, logits=None, validate_args=None):
         if probs is not None:
-            self.is_scalar = isinstance(probs, float) or isinstance(probs, int)
+            self.is_scalar = isinstance(probs, (float, int))
             self._param = probs
         elif logits is not None:
-            self.is_scalar = isinstance(logits, float) or isinstance(logits, int)
+            self.is_scalar = isinstance(logits, (float, int))
             self._param = logits
         else:
             raise ValueError(
@@ -17,8 +17,8 @@ class Bernoulli(Distribution):
             )
 
         if self.is_scalar:
-            empty_tensor = torch.Tensor()
-            batch_shape = empty_tensor.shape
+            # scalar parameter has an empty batch shape. no need to build a tensor for it.
+            batch_shape = ()
         else:
             batch_shape = self._param.shape
         self._batch_shape = batch_shape
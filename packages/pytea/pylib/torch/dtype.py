@@ -1,6 +1,7 @@
 class dtype:
     def __eq__(self, other):
-        return self.__name__ == other.__name__
+        # each dtype is a single class object.
+        return self is other
 
 
 class complex128(dtype):
@@ -60,7 +61,7 @@ short = int16
 int = int32
 long = int64
 
-floatTypes = [float64, float32, float16]
+floatTypes = (float64, float32, float16)
 
 floatDefault = float32
 intDefault = int64
@@ -70,9 +71,11 @@ def maxDtype(*tensors):
     maxPrecedence = -1
     dtype = None
     for tensor in tensors:
-        if isinstance(tensor.dtype, str):
-            raise Exception("tensor.dtype is " + tensor.dtype)
-        if tensor.dtype.precedence > maxPrecedence:
-            maxPrecedence = tensor.dtype.precedence
-            dtype = tensor.dtype
+        tensorDtype = tensor.dtype
+        if isinstance(tensorDtype, str):
+            raise Exception("tensor.dtype is " + tensorDtype)
+        precedence = tensorDtype.precedence
+        if precedence > maxPrecedence:
+            maxPrecedence = precedence
+            dtype = tensorDtype
     return dtype
@@ -1,11 +1,20 @@
 import LibCall
 import torch
-from collections import namedtuple
 import numpy as np
 from torch.tensor import Tensor
+from .dtype import floatDefault as _floatDefault, intDefault as _intDefault
 
 
-torchValIdx = namedtuple("torchValIdx", ["values", "indices"])
+# (values, indices) pair returned by max and topk.
+# fixed two-field tuple; skips the generic namedtuple *args/**kwargs binding.
+class torchValIdx(tuple):
+    def __init__(self, values, indices):
+        LibCall.builtins.namedtuple_setFields(
+            self, ["values", "indices"], (values, indices)
+        )
+
+    def __len__(self):
+        return 2
 
 
 def tensor(data, dtype=None, device=None, requires_grad=False, pin_memory=False):
@@ -15,237 +24,272 @@ def tensor(data, dtype=None, device=None, requires_grad=False, pin_memory=False)
     return result
 
 
-def rand(*size, out=None, dtype=None, **kwargs):
+# the *_like factories only copy the input shape; without dtype, identityShape keeps it.
+def _like(
+    input, dtype=None, layout=None, device=None, requires_grad=False, memory_format=None
+):
     if dtype is None:
-        dtype = torch.floatDefault
-    tensor = Tensor(*size, dtype=dtype)
-    LibCall.torch.copyOut(tensor, out)
-    return tensor
-
-
-def rand_like(input, dtype=None, **kwargs):
+        return LibCall.torch.identityShape(input)
+    return LibCall.torch.identityShapeWithOut(input, None, dtype)
+
+
+def rand(
+    *size,
+    generator=None,
+    out=None,
+    dtype=None,
+    layout=None,
+    device=None,
+    requires_grad=False,
+    pin_memory=False,
+):
     if dtype is None:
-        dtype = input.dtype
-    tensor = LibCall.torch.identityShape(input)
-    tensor.dtype = dtype
+        dtype = _floatDefault
+    tensor = LibCall.torch.sizedTensor(size, dtype)
+    if out is not None:
+        LibCall.torch.copyOut(tensor, out)
     return tensor
 
 
-def empty(*size, out=None, dtype=None, **kwargs):
-    if dtype is None:
-        dtype = torch.floatDefault
-    tensor = Tensor(*size, dtype=dtype)
-    LibCall.torch.copyOut(tensor, out)
-    return tensor
+rand_like = _like
 
 
-def randn(*size, out=None, dtype=None, **kwargs):
+def empty(
+    *size,
+    out=None,
+    dtype=None,
+    layout=None,
+    device=None,
+    requires_grad=False,
+    pin_memory=False,
+    memory_format=None,
+):
     if dtype is None:
-        dtype = torch.floatDefault
-    tensor = Tensor(*size, dtype=dtype)
-    LibCall.torch.copyOut(tensor, out)
+        dtype = _floatDefault
+    tensor = LibCall.torch.sizedTensor(size, dtype)
+    if out is not None:
+        LibCall.torch.copyOut(tensor, out)
     return tensor
 
 
-def randn_like(input, dtype=None, **kwargs):
+def randn(
+    *size,
+    generator=None,
+    out=None,
+    dtype=None,
+    layout=None,
+    device=None,
+    requires_grad=False,
+    pin_memory=False,
+):
     if dtype is None:
-        dtype = input.dtype
-    tensor = LibCall.torch.identityShape(input)
-    tensor.dtype = dtype
+        dtype = _floatDefault
+    tensor = LibCall.torch.sizedTensor(size, dtype)
+    if out is not None:
+        LibCall.torch.copyOut(tensor, out)
     return tensor
 
 
-# TODO: optional low
-def randint(*args, **kwargs):
-    dtype = torch.intDefault
-    if "dtype" in kwargs:
-        dtype = kwargs["dtype"]
-
-    size = args[1]
-    if len(args) > 2:
-        size = args[2]
-    tensor = Tensor(*size, dtype=dtype)
-    return tensor
+randn_like = _like
 
 
-def randint_like(input, low=0, high=1, dtype=None, **kwargs):
+def randint(
+    low=0,
+    high=None,
+    size=None,
+    generator=None,
+    out=None,
+    dtype=None,
+    layout=None,
+    device=None,
+    requires_grad=False,
+):
+    if size is None:  # randint(high, size)
+        size = high
     if dtype is None:
-        dtype = input.dtype
-    tensor = LibCall.torch.identityShape(input)
-    tensor.dtype = dtype
+        dtype = _intDefault
+    tensor = LibCall.torch.sizedTensor(size, dtype)
+    if out is not None:
+        LibCall.torch.copyOut(tensor, out)
     return tensor
 
 
-def ones(*size, out=None, dtype=None, **kwargs):
-    if dtype is None:
-        dtype = torch.floatDefault
-    tensor = Tensor(*size, dtype=dtype)
-    LibCall.torch.copyOut(tensor, out)
-    return tensor
+def randint_like(
+    input,
+    low=0,
+    high=1,
+    dtype=None,
+    layout=None,
+    device=None,
+    requires_grad=False,
+    memory_format=None,
+):
+    return _like(input, dtype)
 
 
-def ones_like(input, dtype=None, **kwargs):
+def ones(*size, out=None, dtype=None, layout=None, device=None, requires_grad=False):
     if dtype is None:
-        dtype = input.dtype
-    tensor = LibCall.torch.identityShape(input)
-    tensor.dtype = dtype
+        dtype = _floatDefault
+    tensor = LibCall.torch.sizedTensor(size, dtype)
+    if out is not None:
+        LibCall.torch.copyOut(tensor, out)
     return tensor
 
 
-def zeros(*size, out=None, dtype=None, **kwargs):
-    if dtype is None:
-        dtype = torch.floatDefault
-    tensor = Tensor(*size, dtype=dtype)
-    LibCall.torch.copyOut(tensor, out)
-    return tensor
+ones_like = _like
 
 
-def zeros_like(input, dtype=None, **kwargs):
+def zeros(*size, out=None, dtype=None, layout=None, device=None, requires_grad=False):
     if dtype is None:
-        dtype = input.dtype
-    tensor = LibCall.torch.identityShape(input)
-    tensor.dtype = dtype
+        dtype = _floatDefault
+    tensor = LibCall.torch.sizedTensor(size, dtype)
+    if out is not None:
+        LibCall.torch.copyOut(tensor, out)
     return tensor
 
 
-def eye(n, m=None, out=None, dtype=None, **kwargs):
+zeros_like = _like
+
+
+def eye(n, m=None, out=None, dtype=None, layout=None, device=None, requires_grad=False):
     if dtype is None:
-        dtype = torch.floatDefault
+        dtype = _floatDefault
     if m is None:
         m = n
-    tensor = Tensor(n, m, dtype=dtype)
-    LibCall.torch.copyOut(tensor, out)
+    tensor = LibCall.torch.sizedTensor((n, m), dtype)
+    if out is not None:
+        LibCall.torch.copyOut(tensor, out)
     return tensor
 
 
+# tensors to be joined mostly share one dtype; promote only when they differ.
+def _seqDtype(tensors):
+    dtype = tensors[0].dtype
+    for tensor in tensors:
+        if tensor.dtype is not dtype:
+            return torch.maxDtype(*tensors)
+    return dtype
+
+
 def cat(tensors, dim=0, out=None):
     tensor = LibCall.torch.cat(tensors, dim)
-    tensor.dtype = torch.maxDtype(*tensors)
-    LibCall.torch.copyOut(tensor, out)
+    tensor.dtype = _seqDtype(tensors)
+    if out is not None:
+        LibCall.torch.copyOut(tensor, out)
     return tensor
 
 
 def stack(tensors, dim=0, out=None):
     tensor = LibCall.torch.stack(tensors, dim)
-    tensor.dtype = torch.maxDtype(*tensors)
-    LibCall.torch.copyOut(tensor, out)
+    tensor.dtype = _seqDtype(tensors)
+    if out is not None:
+        LibCall.torch.copyOut(tensor, out)
     return tensor
 
 
 def squeeze(input, dim=None, out=None):
-    dtype = input.dtype
-    tensor = LibCall.torch.squeeze(input, dim)
-    tensor.dtype = dtype
-    return tensor
+    return LibCall.torch.squeeze(input, dim)
 
 
 def unsqueeze(input, dim):
-    dtype = input.dtype
-    tensor = LibCall.torch.unsqueeze(input, dim)
-    tensor.dtype = dtype
-    return tensor
+    return LibCall.torch.unsqueeze(input, dim)
 
 
 def diag(input, diagonal=0, out=None):
-    dtype = input.dtype
     tensor = LibCall.torch.diag(input, diagonal)
-    tensor.dtype = dtype
-    LibCall.torch.copyOut(tensor, out)
+    if out is not None:
+        LibCall.torch.copyOut(tensor, out)
     return tensor
 
 
 def matmul(input, other, out=None):
+    # torch.matmul rejects ndarrays, which LibCall.torch.matmul would accept by shape.
     if not (isinstance(input, Tensor) and isinstance(other, Tensor)):
         raise TypeError("not a torch.Tensor object")
-    if not (input.dtype == other.dtype):
+    if input.dtype is not other.dtype:
         raise TypeError("Tensor dtype mismatch")
     dtype = input.dtype
     tensor = LibCall.torch.matmul(input, other)
     tensor.dtype = dtype
-    LibCall.torch.copyOut(tensor, out)
+    if out is not None:
+        LibCall.torch.copyOut(tensor, out)
     return tensor
 
 
 def mm(input, mat2, out=None):
-    if not (input.dtype == mat2.dtype):
+    if input.dtype is not mat2.dtype:
         raise TypeError("Tensor dtype mismatch")
     dtype = input.dtype
     tensor = LibCall.torch.mm(input, mat2)
     tensor.dtype = dtype
-    LibCall.torch.copyOut(tensor, out)
+    if out is not None:
+        LibCall.torch.copyOut(tensor, out)
     return tensor
 
 
 def bmm(input, mat2, deterministic=False, out=None):
-    if not (input.dtype == mat2.dtype):
+    if input.dtype is not mat2.dtype:
         raise TypeError("Tensor dtype mismatch")
     dtype = input.dtype
     tensor = LibCall.torch.bmm(input, mat2)
     tensor.dtype = dtype
-    LibCall.torch.copyOut(tensor, out)
+    if out is not None:
+        LibCall.torch.copyOut(tensor, out)
     return tensor
 
 
 def topk(input, k, dim=None, largest=True, sorted=True, out=None):
     tensor = LibCall.torch.topk(input, k, dim)
-    tensor.dtype = input.dtype
-    index = zeros_like(tensor)
-    index.dtype = torch.intDefault
+    index = LibCall.torch.identityShapeWithOut(tensor, None, _intDefault)
     return torchValIdx(tensor, index)
 
 
 def transpose(input, dim0, dim1):
-    dtype = input.dtype
-    tensor = LibCall.torch.transpose(input, dim0, dim1)
-    tensor.dtype = dtype
-    return tensor
+    return LibCall.torch.transpose(input, dim0, dim1)
 
 
 def t(input):
     rank = len(input.shape)
-    if rank > 2:
-        raise ValueError("t() expects a tensor with <= 2 dimensions")
-    elif rank == 2:
-        return input.transpose(1, 0)
-    return input
+    if rank == 2:
+        return LibCall.torch.transpose(input, 1, 0)
+    elif rank < 2:
+        return input
+    raise ValueError("t() expects a tensor with <= 2 dimensions")
 
 
 def reshape(input, shape):
-    dtype = input.dtype
-    tensor = input.reshape(*shape)
-    tensor.dtype = dtype
-    return tensor
+    return input.reshape(*shape)
 
 
 def argmax(input, dim=None, keepdim=False):
     tensor = LibCall.torch.reduce(input, dim, keepdim)
-    tensor.dtype = torch.intDefault
+    tensor.dtype = _intDefault
     return tensor
 
 
 def max(input, dim=None, keepdim=False, out=None):
-    dtype = input.dtype
+    if not (dim is None or isinstance(dim, int)):
+        return torch.maximum(input, dim, out)
+
+    tensor = LibCall.torch.reduce(input, dim, keepdim)
+    tensor.dtype = input.dtype
     if dim is None:
-        tensor = LibCall.torch.reduce(input, dim, keepdim)
-        tensor.dtype = dtype
-        LibCall.torch.copyOut(tensor, out)
-        return tensor
-    elif isinstance(dim, int):
-        tensor = LibCall.torch.reduce(input, dim, keepdim)
-        tensor.dtype = dtype
-        indice = LibCall.torch.reduce(input, dim, keepdim)
-        indice.dtype = torch.intDefault
         if out is not None:
-            LibCall.torch.copyOut(tensor, out[0])
-            LibCall.torch.copyOut(indice, out[1])
-        return torchValIdx(tensor, indice)
-    else:
-        return torch.maximum(input, dim, out)
+            LibCall.torch.copyOut(tensor, out)
+        return tensor
+
+    # indices have the shape of the values; no second reduction is needed.
+    indice = LibCall.torch.identityShapeWithOut(tensor, None, _intDefault)
+    if out is not None:
+        LibCall.torch.copyOut(tensor, out[0])
+        LibCall.torch.copyOut(indice, out[1])
+    return torchValIdx(tensor, indice)
 
 
 def maximum(input, other, out=None):
     tensor = _bop(input, other)
-    LibCall.torch.copyOut(tensor, out)
+    if out is not None:
+        LibCall.torch.copyOut(tensor, out)
     return tensor
 
 
@@ -259,8 +303,8 @@ def mean(input, dim=None, keepdim=False, dtype=None, out=None):
 
 def sum(input, dim=None, keepdim=False, dtype=None):
     if dtype is None:
-        if input.dtype == torch.bool:
-            dtype = torch.intDefault
+        if input.dtype is torch.bool:
+            dtype = _intDefault
         else:
             dtype = input.dtype
 
@@ -285,165 +329,141 @@ def logdet(input):
 
 def mul(input, other, out=None):
     result = _bop(input, other)
-    LibCall.torch.copyOut(result, out)
+    if out is not None:
+        LibCall.torch.copyOut(result, out)
     return result
 
 
 def pow(input, exponent, out=None):
     result = _bop(input, exponent)
-    LibCall.torch.copyOut(result, out)
+    if out is not None:
+        LibCall.torch.copyOut(result, out)
     return result
 
 
-def abs(input, out=None):
-    result = LibCall.torch.identityShape(input)
-    LibCall.torch.copyOut(result, out)
-    return result
+# elementwise ops share their wrappers; only the result dtype differs.
+def _sameDtypeUnary(input, out=None):
+    return LibCall.torch.identityShapeWithOut(input, out, input.dtype)
 
 
-def neg(input, out=None):
-    result = LibCall.torch.identityShape(input)
-    LibCall.torch.copyOut(result, out)
-    return result
-
-
-negative = neg
-
-
-def exp(input, out=None):
-    result = LibCall.torch.identityShape(input)
-    LibCall.torch.copyOut(result, out)
-    return result
-
-
-def expm1(input, out=None):
-    result = LibCall.torch.identityShape(input)
-    LibCall.torch.copyOut(result, out)
-    return result
-
-
-def log(input, out=None):
-    result = LibCall.torch.identityShape(input)
-    LibCall.torch.copyOut(result, out)
-    return result
-
-
-def log10(input, out=None):
-    result = LibCall.torch.identityShape(input)
-    LibCall.torch.copyOut(result, out)
-    return result
-
-
-def log1p(input, out=None):
-    result = LibCall.torch.identityShape(input)
-    LibCall.torch.copyOut(result, out)
-    return result
+def _floatUnary(input, out=None):
+    # integral and bool dtypes rank below float16; floating inputs keep their dtype.
+    dtype = input.dtype
+    if dtype.precedence < torch.float16.precedence:
+        dtype = _floatDefault
+    return LibCall.torch.identityShapeWithOut(input, out, dtype)
 
 
-def log2(input, out=None):
-    result = LibCall.torch.identityShape(input)
-    LibCall.torch.copyOut(result, out)
-    return result
+abs = _sameDtypeUnary
+neg = _sameDtypeUnary
+negative = _sameDtypeUnary
+exp = _floatUnary
+expm1 = _floatUnary
+log = _floatUnary
+log10 = _floatUnary
+log1p = _floatUnary
+log2 = _floatUnary
+sqrt = _floatUnary
+tanh = _floatUnary
+sigmoid = _floatUnary
 
 
 def bernoulli(input, generator=None, out=None):
-    result = LibCall.torch.identityShape(input)
-    LibCall.torch.copyOut(result, out)
-    return result
+    return LibCall.torch.identityShapeWithOut(input, out, input.dtype)
 
 
+# operands are tested from the most frequent: tensor, python scalars, then ndarray.
 def _bop(tensor, other):
     if isinstance(other, Tensor):
-        dtype = torch.maxDtype(tensor, other)
+        dtype = tensor.dtype
+        if dtype is not other.dtype:
+            dtype = torch.maxDtype(tensor, other)
         tensor = LibCall.torch.broadcast(tensor, other)
         tensor.dtype = dtype
         return tensor
-    elif isinstance(other, np.ndarray):
-        return LibCall.torch.broadcast(tensor, other)
     elif isinstance(other, int):
-        dtype = tensor.dtype
-        tensor = LibCall.torch.identityShape(tensor)
-        tensor.dtype = dtype
-        return tensor
+        return LibCall.torch.identityShape(tensor)
     elif isinstance(other, float):
-        if (
-            tensor.dtype is torch.float64
-            or tensor.dtype is torch.float32
-            or tensor.dtype is torch.float16
-        ):
-            dtype = tensor.dtype
-        else:
-            dtype = torch.floatDefault
-        tensor = LibCall.torch.identityShape(tensor)
-        tensor.dtype = dtype
-        return tensor
+        # float16, float32 and float64 occupy a contiguous precedence band.
+        precedence = tensor.dtype.precedence
+        if precedence < torch.float16.precedence or precedence > torch.float64.precedence:
+            return LibCall.torch.identityShapeWithOut(tensor, None, _floatDefault)
+        return LibCall.torch.identityShape(tensor)
+    elif isinstance(other, np.ndarray):
+        return LibCall.torch.broadcast(tensor, other)
     else:
         return NotImplemented
 
 
 def flatten(input, start_dim=0, end_dim=-1):
-    dtype = input.dtype
-    tensor = LibCall.torch.flatten(input, start_dim, end_dim)
-    tensor.dtype = dtype
-    return tensor
-
-
-def sqrt(input, out=None):
-    result = LibCall.torch.identityShape(input)
-    LibCall.torch.copyOut(result, out)
-    return result
-
-
-def tanh(input, out=None):
-    result = LibCall.torch.identityShape(input)
-    LibCall.torch.copyOut(result, out)
-    return result
-
-
-def sigmoid(input, out=None):
-    result = LibCall.torch.identityShape(input)
-    LibCall.torch.copyOut(result, out)
-    return result
+    return LibCall.torch.flatten(input, start_dim, end_dim)
 
 
 def relu(input):
-    result = LibCall.torch.identityShape(input)
-    return result
+    return LibCall.torch.identityShape(input)
 
 
 def gelu(input):
-    result = LibCall.torch.identityShape(input)
-    return result
+    return LibCall.torch.identityShape(input)
 
 
 def softmax(input, dim=None, dtype=None):
-    if not (input.dtype in torch.floatTypes):
-        raise TypeError("Can only calculate the softmax of floating types")
     dtype = input.dtype
-    tensor = LibCall.torch.identityShape(input)
-    tensor.dtype = dtype
-    return tensor
-
-
-def arange(start, end=None, step=1, out=None, **kwargs):
+    # float16, float32 and float64 occupy a contiguous precedence band.
+    precedence = dtype.precedence
+    if precedence < torch.float16.precedence or precedence > torch.float64.precedence:
+        raise TypeError("Can only calculate the softmax of floating types")
+    return LibCall.torch.identityShapeWithOut(input, None, dtype)
+
+
+def arange(
+    start,
+    end=None,
+    step=1,
+    out=None,
+    dtype=None,
+    layout=None,
+    device=None,
+    requires_grad=False,
+):
     if end is None:  # arange(N)
         end = start
         start = 0
     if isinstance(start, int) and isinstance(end, int) and isinstance(step, int):
-        dtype = torch.intDefault
+        # ceiling division towards the step direction, without a float round-trip.
+        # empty range has zero length.
+        if step == 1:
+            length = LibCall.math.clamp_nonneg(end - start)
+        elif step > 0:
+            length = LibCall.math.clamp_nonneg((end - start + step - 1) // step)
+        else:
+            length = LibCall.math.clamp_nonneg((end - start + step + 1) // step)
+        if dtype is None:
+            dtype = _intDefault
     else:
-        dtype = torch.floatDefault
-    tensor = Tensor(int((end - start) / step))
-    tensor.dtype = dtype
-    LibCall.torch.copyOut(tensor, out)
+        length = int((end - start) / step)
+        if dtype is None:
+            dtype = _floatDefault
+    tensor = LibCall.torch.sizedTensor((length,), dtype)
+    if out is not None:
+        LibCall.torch.copyOut(tensor, out)
     return tensor
 
 
-def full(size, fill_value, out=None, dtype=None, **kwargs):
+def full(
+    size,
+    fill_value,
+    out=None,
+    dtype=None,
+    layout=None,
+    device=None,
+    requires_grad=False,
+):
     if dtype is None:
-        dtype = torch.floatDefault
-    tensor = Tensor(*size, dtype=dtype)
-    LibCall.torch.copyOut(tensor, out)
+        dtype = _floatDefault
+    tensor = LibCall.torch.sizedTensor(size, dtype)
+    if out is not None:
+        LibCall.torch.copyOut(tensor, out)
     return tensor
 
 
@@ -178,15 +178,11 @@ def gelu(input):
 
 
 def tanh(input, out=None):
-    result = LibCall.torch.identityShape(input)
-    LibCall.torch.copyOut(result, out)
-    return result
+    return torch.tanh(input, out)
 
 
 def sigmoid(input, out=None):
-    result = LibCall.torch.identityShape(input)
-    LibCall.torch.copyOut(result, out)
-    return result
+    return torch.sigmoid(input, out)
 
 
 def embedding(
@@ -6,7 +6,7 @@ from .. import functional as F
 class ReflectionPad2d(Module):
     def __init__(self, padding):
         super(ReflectionPad2d, self).__init__()
-        if isinstance(padding, tuple) or isinstance(padding, list):
+        if isinstance(padding, (tuple, list)):
             self.padding = padding
         else:
             self.padding = (padding, padding, padding, padding)
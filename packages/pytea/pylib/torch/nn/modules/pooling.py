@@ -43,7 +43,7 @@ class MaxPool2d(Module):
 class AdaptiveAvgPool2d(_AvgPoolNd):
     def __init__(self, output_size):
         super(AdaptiveAvgPool2d, self).__init__()
-        if isinstance(output_size, tuple) or isinstance(output_size, list):
+        if isinstance(output_size, (tuple, list)):
             self.output_size = output_size
         else:
             self.output_size = (output_size, output_size)
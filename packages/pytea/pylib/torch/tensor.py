@@ -147,9 +147,7 @@ class Tensor:
         return self
 
     def repeat(self, *sizes):
-        tensor = LibCall.torch.repeat(self, sizes)
-        tensor.dtype = self.dtype
-        return tensor
+        return LibCall.torch.repeat(self, sizes)
 
     def transpose(self, dim0, dim1):
         return torch.transpose(self, dim0, dim1)
@@ -183,17 +181,13 @@ class Tensor:
         return torch._bop(self, other)
 
     def view(self, *shape):
-        tensor = LibCall.torch.view(self, shape)
-        tensor.dtype = self.dtype
-        return tensor
+        return LibCall.torch.view(self, shape)
 
     def view_as(self, other):
         return self.view(other.size())
 
     def reshape(self, *shape):
-        tensor = LibCall.torch.view(self, shape)
-        tensor.dtype = self.dtype
-        return tensor
+        return LibCall.torch.view(self, shape)
 
     def reshape_as(self, other):
         return self.view(other.size())
@@ -238,12 +232,10 @@ class Tensor:
             return self.type(firstArg.dtype)
         elif isinstance(firstArg, str):  # device
             tensor = LibCall.torch.identityShape(self)
-            tensor.dtype = self.dtype
             tensor.device = firstArg
             return tensor
         elif isinstance(firstArg, torch.device):
             tensor = LibCall.torch.identityShape(self)
-            tensor.dtype = self.dtype
             tensor.device = firstArg
             return tensor
         else:
@@ -257,9 +249,7 @@ class Tensor:
         elif self.dtype is dtype:
             return self
         else:
-            tensor = LibCall.torch.identityShape(self)
-            tensor.dtype = dtype
-            return tensor
+            return LibCall.torch.identityShapeWithOut(self, None, dtype)
 
     def bool(self):
         return self.to(torch.bool)
@@ -271,53 +261,43 @@ class Tensor:
         return self.to(torch.int64)
 
     def detach(self):
-        tensor = LibCall.torch.identityShape(self)
-        tensor.dtype = self.dtype
-        return tensor
+        return LibCall.torch.identityShape(self)
 
     def clone(self):
-        tensor = LibCall.torch.identityShape(self)
-        tensor.dtype = self.dtype
-        return tensor
+        return LibCall.torch.identityShape(self)
 
     def cpu(self):
-        tensor = LibCall.torch.identityShape(self)
-        tensor.dtype = self.dtype
-        return tensor
+        return LibCall.torch.identityShape(self)
 
     def flatten(self, start_dim=0, end_dim=-1):
-        tensor = LibCall.torch.flatten(self, start_dim, end_dim)
-        tensor.dtype = self.dtype
-        return tensor
+        return LibCall.torch.flatten(self, start_dim, end_dim)
 
     def expand(self, *sizes):
-        tensor = LibCall.torch.expand(self, sizes)
-        tensor.dtype = self.dtype
-        return tensor
+        return LibCall.torch.expand(self, sizes)
 
     def expand_as(self, other):
-        tensor = LibCall.torch.expand_as(self, other)
-        tensor.dtype = self.dtype
-        return tensor
+        return LibCall.torch.expand_as(self, other)
 
     def device(self):
         return "cuda"
 
     def permute(self, *args):
+        # permute(dims) with a single sequence of dims
+        if len(args) == 1 and isinstance(args[0], (tuple, list)):
+            args = args[0]
         ndim = self.dim()
         if ndim != len(args):
             raise ValueError("permute shape mismatched")
-        ret_shape = []
+        seen = []
         for arg in args:
-            # TODO: add duplicated indices assertion
-            # currently, __setitem__ for list is not supported
             if arg < 0 or arg >= ndim:
                 raise ValueError("permute invalid index!")
-            ret_shape.append(self.shape[arg])
+            if arg in seen:
+                raise ValueError("permute repeated dim!")
+            seen.append(arg)
 
-        tensor = self.view(*ret_shape)
-        tensor.dtype = self.dtype
-        return tensor
+        shape = self.shape
+        return LibCall.torch.view(self, [shape[arg] for arg in args])
 
     def contiguous(self):
         return self
@@ -334,8 +314,7 @@ class Tensor:
             idx_len = len(index)
             if idx_len > len(self.shape):
                 raise IndexError("too many indices for tensor")
-            for axis in range(idx_len - 1, -1, -1):
-                temp = LibCall.shape.tensorGetItem(temp, axis, index[axis])
+            temp = LibCall.shape.tensorGetItems(temp, index)
             return Tensor(temp)
 
         if len(temp) <= 0:
@@ -432,9 +411,7 @@ class Tensor:
         return tensor
 
     def __abs__(self):
-        tensor = LibCall.torch.identityShape(self)
-        tensor.dtype = self.dtype
-        return tensor
+        return LibCall.torch.identityShape(self)
 
     def __eq__(self, other):
         return torch._bop(self, other)
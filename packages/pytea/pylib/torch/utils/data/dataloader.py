@@ -57,7 +57,7 @@ class DataLoader:
 
         ret_list = []
         for item in item_tuple:
-            if isinstance(item, list) or isinstance(item, tuple):
+            if isinstance(item, (list, tuple)):
                 ret_item = []
                 for list_item in item:
                     if isinstance(list_item, torch.Tensor) and list_item.dim() > 0:
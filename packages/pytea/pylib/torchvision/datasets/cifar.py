@@ -19,8 +19,7 @@ class CIFAR10(data.Dataset):
             self._len = 10000
 
     def __getitem__(self, index):
-        img = Image.Image()
-        img._setSize(3, 32, 32)
+        img = Image.Image(3, 32, 32)
         target = LibCall.builtins.randInt(0, 9, "CIFAR10_Class")
 
         if self.transform is not None:
@@ -51,8 +50,7 @@ class CIFAR100(data.Dataset):
             self._len = 10000
 
     def __getitem__(self, index):
-        img = Image.Image()
-        img._setSize(3, 32, 32)
+        img = Image.Image(3, 32, 32)
         target = LibCall.builtins.randInt(0, 99, "CIFAR100_Class")
 
         if self.transform is not None:
@@ -26,8 +26,7 @@ class MNIST(data.Dataset):
             self._len = 10000
 
     def __getitem__(self, index):
-        img = Image.Image()
-        img._setSize(1, 28, 28)
+        img = Image.Image(1, 28, 28)
         target = LibCall.builtins.randInt(0, 9, "MNIST_Class")
 
         if self.transform is not None:
@@ -28,7 +28,7 @@ def to_pil_image(pic, mode=None):
 def normalize(tensor, mean, std, inplace=False):
     if not isinstance(tensor, torch.Tensor):
         raise TypeError("Input tensor should be a torch tensor.")
-    meanLen = len(mean) if isinstance(mean, list) or isinstance(mean, tuple) else 1
-    stdLen = len(std) if isinstance(std, list) or isinstance(std, tuple) else 1
+    meanLen = len(mean) if isinstance(mean, (list, tuple)) else 1
+    stdLen = len(std) if isinstance(std, (list, tuple)) else 1
     return LibCall.torchvision.normalize(tensor, meanLen, stdLen)
 
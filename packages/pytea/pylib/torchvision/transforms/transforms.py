@@ -58,7 +58,7 @@ class RandomCrop:
     def __init__(
         self, size, padding=None, pad_if_needed=False, fill=0, padding_mode="constant"
     ):
-        if isinstance(size, tuple) or isinstance(size, list):
+        if isinstance(size, (tuple, list)):
             self.size = size
         else:
             self.size = (int(size), int(size))
@@ -70,8 +70,7 @@ class RandomCrop:
 
     def __call__(self, img):
         if isinstance(img, Image.Image):
-            image = Image.Image()
-            image._setSize(img._getChannel(), self.size[0], self.size[1])
+            image = Image.Image(img._getChannel(), self.size[0], self.size[1])
             return image
         else:
             return LibCall.torchvision.crop(img, self.size[0], self.size[1])
@@ -81,7 +80,7 @@ class RandomResizedCrop:
     def __init__(
         self, size, scale=(0.08, 1.0), ratio=(3.0 / 4.0, 4.0 / 3.0), interpolation=2
     ):
-        if isinstance(size, tuple) or isinstance(size, list):
+        if isinstance(size, (tuple, list)):
             self.size = size
         else:
             self.size = (int(size), int(size))
@@ -92,8 +91,7 @@ class RandomResizedCrop:
 
     def __call__(self, img):
         if isinstance(img, Image.Image):
-            image = Image.Image()
-            image._setSize(img._channel, self.size[0], self.size[1])
+            image = Image.Image(img._channel, self.size[0], self.size[1])
             return image
         else:
             return LibCall.torchvision.crop(img, self.size[0], self.size[1])
@@ -101,15 +99,14 @@ class RandomResizedCrop:
 
 class CenterCrop:
     def __init__(self, size):
-        if isinstance(size, tuple) or isinstance(size, list):
+        if isinstance(size, (tuple, list)):
             self.size = size
         else:
             self.size = (int(size), int(size))
 
     def __call__(self, img):
         if isinstance(img, Image.Image):
-            image = Image.Image()
-            image._setSize(img._channel, self.size[0], self.size[1])
+            image = Image.Image(img._channel, self.size[0], self.size[1])
             return image
         else:
             return LibCall.torchvision.crop(img, self.size[0], self.size[1])
@@ -117,7 +114,7 @@ class CenterCrop:
 
 class Resize:
     def __init__(self, size, interpolation=2):
-        if isinstance(size, tuple) or isinstance(size, list):
+        if isinstance(size, (tuple, list)):
             self.size = size
         else:
             self.size = (int(size), int(size))
@@ -126,8 +123,7 @@ class Resize:
 
     def __call__(self, img):
         if isinstance(img, Image.Image):
-            image = Image.Image()
-            image._setSize(img._channel, self.size[0], self.size[1])
+            image = Image.Image(img._channel, self.size[0], self.size[1])
             return image
         else:
             return LibCall.torchvision.crop(img, self.size[0], self.size[1])
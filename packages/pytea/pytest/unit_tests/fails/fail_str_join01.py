@@ -0,0 +1,12 @@
+'''
+fail_str_join01.py
+Copyright (c) Seoul National University
+Licensed under the MIT license.
+
+str.join raises TypeError for a non-str item.
+'''
+
+import torch
+
+dims = [2, 3]
+name = "x".join(dims)
@@ -0,0 +1,22 @@
+'''
+pass_arange_basic01.py
+Copyright (c) Seoul National University
+Licensed under the MIT license.
+
+Length of integer torch.arange with positive, negative and empty ranges.
+'''
+
+import torch
+
+a = torch.arange(0, 5, 2)
+b = torch.arange(5, 2)
+c = torch.arange(5, 0, -2)
+d = torch.arange(10, 0, -3)
+e = torch.arange(0, 5, -1)
+
+# shape assertion
+a + torch.rand(3)
+b + torch.rand(0)
+c + torch.rand(3)
+d + torch.rand(4)
+e + torch.rand(0)
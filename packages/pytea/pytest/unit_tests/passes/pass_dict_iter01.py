@@ -0,0 +1,22 @@
+'''
+pass_dict_iter01.py
+Copyright (c) Seoul National University
+Licensed under the MIT license.
+
+Iterating a dict yields the same keys, in the same order, as dict.keys().
+'''
+
+import torch
+
+d = {"a": 2, "b": 3, "c": 4}
+
+dims = []
+for k in d:
+    dims.append(d[k])
+
+keys = list(d)
+
+# shape assertion
+torch.rand(*dims) + torch.rand(2, 3, 4)
+torch.rand(len(keys)) + torch.rand(len(d.keys()))
+torch.rand(d[keys[0]], d[keys[2]]) + torch.rand(2, 4)
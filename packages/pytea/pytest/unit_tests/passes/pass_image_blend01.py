@@ -0,0 +1,19 @@
+'''
+pass_image_blend01.py
+Copyright (c) Seoul National University
+Licensed under the MIT license.
+
+PIL.Image.blend returns an image with the size of its first argument.
+'''
+
+import torch
+from PIL import Image
+
+im1 = Image.new("RGB", (48, 32))
+im2 = Image.new("RGB", (48, 32))
+out = Image.blend(im1, im2, 0.5)
+w, h = out.size
+
+# shape assertion
+torch.rand(out.height, out.width) + torch.rand(32, 48)
+torch.rand(h, w) + torch.rand(32, 48)
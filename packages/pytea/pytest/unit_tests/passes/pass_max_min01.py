@@ -0,0 +1,16 @@
+'''
+pass_max_min01.py
+Copyright (c) Seoul National University
+Licensed under the MIT license.
+
+Builtin max and min over arguments, sequences and iterators.
+'''
+
+import torch
+
+a = [3, 5, 2]
+
+# shape assertion
+torch.rand(max(a), min(a)) + torch.rand(5, 2)
+torch.rand(max(3, 6), min(3, 6)) + torch.rand(6, 3)
+torch.rand(max(x + 1 for x in a), min(iter(a))) + torch.rand(6, 2)
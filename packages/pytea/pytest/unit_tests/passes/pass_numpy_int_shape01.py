@@ -0,0 +1,22 @@
+'''
+pass_numpy_int_shape01.py
+Copyright (c) Seoul National University
+Licensed under the MIT license.
+
+numpy array constructors take a single int as a 1-D shape.
+'''
+
+import numpy as np
+import torch
+
+a = np.zeros(3)
+b = np.empty(5)
+c = np.random.randint(0, 5, size=4)
+d = np.zeros((2, 3))
+
+# shape assertion
+torch.rand(*a.shape) + torch.rand(3)
+torch.rand(*b.shape) + torch.rand(5)
+torch.rand(*c.shape) + torch.rand(4)
+torch.rand(*d.shape) + torch.rand(2, 3)
+torch.rand(len(a), len(c)) + torch.rand(3, 4)
@@ -0,0 +1,16 @@
+'''
+pass_slice_step02.py
+Copyright (c) Seoul National University
+Licensed under the MIT license.
+
+Stepped slices of a python tuple.
+'''
+
+import torch
+
+a = (2, 3, 4, 5, 6)
+
+# shape assertion
+torch.rand(*a[::-1]) + torch.rand(6, 5, 4, 3, 2)
+torch.rand(*a[3::-1]) + torch.rand(5, 4, 3, 2)
+torch.rand(*a[::2]) + torch.rand(2, 4, 6)
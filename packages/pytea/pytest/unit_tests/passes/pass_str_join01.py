@@ -0,0 +1,16 @@
+'''
+pass_str_join01.py
+Copyright (c) Seoul National University
+Licensed under the MIT license.
+
+str.join over lists, tuples and generators of strings.
+'''
+
+import torch
+
+s1 = "-".join(["ab", "c", "d"])
+s2 = "".join(("a", "b"))
+s3 = ", ".join(str(i) for i in range(3))
+
+# shape assertion
+torch.rand(len(s1), len(s2), len(s3)) + torch.rand(6, 2, 7)
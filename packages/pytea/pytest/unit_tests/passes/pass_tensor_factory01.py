@@ -0,0 +1,22 @@
+'''
+pass_tensor_factory01.py
+Copyright (c) Seoul National University
+Licensed under the MIT license.
+
+Tensor factories take their size as separate ints, a tuple or a torch.Size.
+'''
+
+import torch
+
+x = torch.rand(4, 5)
+
+a = torch.zeros((2, 3))
+b = torch.zeros(x.size())
+c = torch.randint(10, (3,))
+d = torch.ones([2, 3, 4])
+
+# shape assertion
+a + torch.rand(2, 3)
+b + torch.rand(4, 5)
+c + torch.rand(3)
+d + torch.rand(2, 3, 4)
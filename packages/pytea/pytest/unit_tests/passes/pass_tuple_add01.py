@@ -0,0 +1,18 @@
+'''
+pass_tuple_add01.py
+Copyright (c) Seoul National University
+Licensed under the MIT license.
+
+Concatenation of tuples and lists.
+'''
+
+import torch
+
+a = (2, 3)
+b = a + (4,)
+c = [5] + list(b)
+
+# shape assertion
+torch.rand(*b) + torch.rand(2, 3, 4)
+torch.rand(*c) + torch.rand(5, 2, 3, 4)
+torch.rand(len(a + b + a)) + torch.rand(7)
@@ -7,7 +7,7 @@
  * Simple expression comparer and calculator
  */
 
-import { fetchAddr, trackMro } from './backUtils';
+import { fetchAddr, sanitizeAddr, trackMro } from './backUtils';
 import { ConstraintSet } from './constraintSet';
 import { Constraint, ConstraintType } from './constraintType';
 import { Context, ContextSet } from './context';
@@ -1111,10 +1111,17 @@ export function isStructuallyEq(left?: SymExp, right?: SymExp): boolean {
     }
 }
 
-export function genTensor<T>(ctx: Context<T>, shape: ExpShape, source: CodeSource | undefined): ContextSet<ShValue> {
+// if `dtype` is given, it is passed to Tensor.__init__ instead of being assigned afterwards.
+export function genTensor<T>(
+    ctx: Context<T>,
+    shape: ExpShape,
+    source: CodeSource | undefined,
+    dtype?: ShValue
+): ContextSet<ShValue> {
     shape = simplifyShape(ctx.ctrSet, shape);
+    const size = SVSize.createSize(ctx, shape, source);
 
-    return TorchBackend.libClassInit(ctx, 'torch.Tensor', [SVSize.createSize(ctx, shape, source)], source);
+    return TorchBackend.libClassInit(ctx, 'torch.Tensor', [size], source, dtype ? { dtype } : undefined);
 }
 
 // return either size of tensor in `mayAddr` or return error message
@@ -1270,12 +1277,10 @@ export function isInstanceOf(inputVal: ShValue, classVal: ShValue, env: ShEnv, h
     const input = fetchAddr(inputVal, heap);
     if (!input) return;
 
-    const mroList = trackMro(inputVal, heap, env);
-
     if (classVal.type !== SVType.Addr) {
         // direct comparison between int / float type function
         return (
-            mroList.findIndex((v) => {
+            trackMro(inputVal, heap, env).findIndex((v) => {
                 if (v === undefined) return false;
                 return fetchAddr(heap.getVal(v), heap) === classVal;
             }) >= 0
@@ -1291,5 +1296,16 @@ export function isInstanceOf(inputVal: ShValue, classVal: ShValue, env: ShEnv, h
         classPoint = next;
     }
 
-    return mroList.findIndex((v) => v === classPoint.addr) >= 0;
+    // fast path: exact class match. (i.e. type(input) is classVal)
+    if (input.type === SVType.Object) {
+        const mro = fetchAddr(input.getAttr('__mro__'), heap);
+        if (mro?.type === SVType.Object) {
+            const inputClass = sanitizeAddr(mro.getIndice(0), heap);
+            if (inputClass?.type === SVType.Addr && inputClass.addr === classPoint.addr) {
+                return true;
+            }
+        }
+    }
+
+    return trackMro(inputVal, heap, env).findIndex((v) => v === classPoint.addr) >= 0;
 }
@@ -503,17 +503,25 @@ export namespace TorchBackend {
             } else {
                 // first, make a list of superclasses
                 mro = BackUtils.trackMro(objVal, ctx.heap, ctx.env);
-                const classes = [];
+
+                // the first __getattr__ of superclasses, recorded while walking the MRO
+                let mroGetAttr: SVFunc | undefined;
 
                 // iterate superclasses and find matching attr.
                 for (const superAddr of mro) {
                     if (superAddr === undefined) continue;
                     const superClass = BackUtils.fetchAddr(SVAddr.create(superAddr, source), ctx.heap);
 
-                    if (!superClass) continue;
-                    classes.push(superClass);
+                    if (superClass?.type !== SVType.Object) continue;
+
+                    if (mroGetAttr === undefined) {
+                        const classGetAttr = BackUtils.fetchAddr(superClass.attrs.get('__getattr__'), ctx.heap);
+                        if (classGetAttr?.type === SVType.Func) {
+                            mroGetAttr = classGetAttr;
+                        }
+                    }
 
-                    const attr = 'attrs' in superClass ? superClass.attrs.get(name) : undefined;
+                    const attr = superClass.attrs.get(name);
                     if (attr) {
                         const mayMethod = BackUtils.fetchAddr(attr, ctx.heap);
 
@@ -534,18 +542,10 @@ export namespace TorchBackend {
                     }
                 }
 
-                // if not found, track __getattr__
-                for (const superClass of classes) {
-                    let getAttr =
-                        superClass.type === SVType.Object
-                            ? BackUtils.fetchAddr(superClass.attrs.get('__getattr__'), ctx.heap)
-                            : undefined;
-                    if (getAttr && getAttr.type === SVType.Func) {
-                        if (objVal.type === SVType.Object) {
-                            getAttr = getAttr.bound(objVal.addr);
-                        }
-                        return functionCall(ctx, getAttr, [SVString.create(name, source)], source);
-                    }
+                // if not found, call __getattr__
+                if (mroGetAttr) {
+                    const getAttr = objVal.type === SVType.Object ? mroGetAttr.bound(objVal.addr) : mroGetAttr;
+                    return functionCall(ctx, getAttr, [SVString.create(name, source)], source);
                 }
             }
 
@@ -1369,7 +1369,8 @@ export namespace TorchBackend {
                 const defaultRetVal: ShValue = SVNotImpl.create(errMsg, expr.source);
                 const [lop, rop] = SymOpUtils.operatorMap[expr.bopType];
 
-                if (leftVal.type === SVType.Object) {
+                // `a in b` is always resolved by `b.__contains__(a)`
+                if (leftVal.type === SVType.Object && expr.bopType !== TEBopType.In) {
                     const lv = leftVal;
                     return ctx.getAttrDeep(lv, lop, expr.source).flatMap((ctx) => {
                         const lopFun = BackUtils.fetchAddr(ctx.retVal, ctx.heap);
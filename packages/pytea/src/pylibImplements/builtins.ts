@@ -20,7 +20,15 @@ import {
     SVString,
     SVType,
 } from '../backend/sharpValues';
-import { ExpNum, ExpNumSymbol, NumBopType, NumUopType, StringOpType, SymExp } from '../backend/symExpressions';
+import {
+    ExpNum,
+    ExpNumSymbol,
+    ExpString,
+    NumBopType,
+    NumUopType,
+    StringOpType,
+    SymExp,
+} from '../backend/symExpressions';
 import { TorchBackend } from '../backend/torchBackend';
 import { PyteaService } from '../service/pyteaService';
 import { LCImpl } from '.';
@@ -86,6 +94,22 @@ export namespace BuiltinsLCImpl {
         const { env, heap } = ctx;
         const [selfAddr, classAddr] = params;
 
+        // isinstance(x, (A, B, ...)): true if x is an instance of any of the classes.
+        const classes = fetchAddr(classAddr, heap);
+        const length = classes?.type === SVType.Object ? fetchAddr(classes.getAttr('$length'), heap) : undefined;
+        if (classes?.type === SVType.Object && length?.type === SVType.Int && typeof length.value === 'number') {
+            for (let i = 0; i < length.value; i++) {
+                const classVal = classes.getIndice(i);
+                const result = classVal ? isInstanceOf(selfAddr, classVal, env, heap) : undefined;
+                if (result === undefined) {
+                    return ctx.warnWithMsg(`from 'LibCall.builtins.isinstance': got invalid address`, source).toSet();
+                } else if (result) {
+                    return ctx.toSetWith(SVBool.create(true, source));
+                }
+            }
+            return ctx.toSetWith(SVBool.create(false, source));
+        }
+
         const result = isInstanceOf(selfAddr, classAddr, env, heap);
         if (result === undefined) {
             return ctx.warnWithMsg(`from 'LibCall.builtins.isinstance': got invalid address`, source).toSet();
@@ -510,6 +534,122 @@ export namespace BuiltinsLCImpl {
         return ctx.setHeap(heap.setVal(dict.addr, dict)).toSetWith(SVNone.create(source));
     }
 
+    // bulk insert every items of src into dest. (dest.update(src) for dict src)
+    export function dict_merge(
+        ctx: Context<LCBase.ExplicitParams>,
+        source: CodeSource | undefined
+    ): ContextSet<ShValue> {
+        const params = ctx.retVal.params;
+        if (params.length !== 2) {
+            return ctx
+                .failWithMsg(
+                    `from 'LibCall.builtins.dict_merge': got insufficient number of argument: ${params.length}`,
+                    source
+                )
+                .toSet();
+        }
+
+        const { heap } = ctx;
+        const dest = fetchAddr(params[0], heap);
+        const src = fetchAddr(params[1], heap);
+
+        if (dest?.type !== SVType.Object || src?.type !== SVType.Object) {
+            return ctx.warnWithMsg(`from 'LibCall.builtins.dict_merge': invalid value type`, source).toSet();
+        }
+
+        let newKeys = 0;
+        src.indices.forEach((_, key) => {
+            if (!dest.indices.has(key)) newKeys++;
+        });
+        src.keyValues.forEach((_, key) => {
+            if (!dest.keyValues.has(key)) newKeys++;
+        });
+
+        let dict = dest
+            .set('indices', dest.indices.merge(src.indices))
+            .set('keyValues', dest.keyValues.merge(src.keyValues));
+        if (newKeys > 0) {
+            const len = dict.getAttr('$length') as SVInt;
+            const newLen = simplifyNum(ctx.ctrSet, ExpNum.bop(NumBopType.Add, len.value, newKeys, source));
+            dict = dict.setAttr('$length', SVInt.create(newLen, source));
+        }
+
+        return ctx.setHeap(heap.setVal(dict.addr, dict)).toSetWith(SVNone.create(source));
+    }
+
+    // materialised string keys of each dict snapshot. keyValues is an immutable map which is
+    // replaced on every update, so a cached key list never goes stale.
+    const dictKeyCache: WeakMap<object, string[]> = new WeakMap();
+
+    function dictKeyList(dict: SVObject): string[] {
+        let keys = dictKeyCache.get(dict.keyValues);
+        if (!keys) {
+            keys = dict.keyValues.keySeq().toArray();
+            dictKeyCache.set(dict.keyValues, keys);
+        }
+        return keys;
+    }
+
+    // number of keys of dict. counts the same (string) keys as dict_keys.
+    export function dict_size(
+        ctx: Context<LCBase.ExplicitParams>,
+        source: CodeSource | undefined
+    ): ContextSet<ShValue> {
+        const params = ctx.retVal.params;
+        if (params.length !== 1) {
+            return ctx
+                .failWithMsg(
+                    `from 'LibCall.builtins.dict_size': got insufficient number of argument: ${params.length}`,
+                    source
+                )
+                .toSet();
+        }
+
+        const dict = fetchAddr(params[0], ctx.heap);
+        if (dict?.type !== SVType.Object) {
+            return ctx.warnWithMsg(`from 'LibCall.builtins.dict_size': invalid value type`, source).toSet();
+        }
+
+        return ctx.toSetWith(SVInt.create(dict.keyValues.size, source));
+    }
+
+    // i-th key of dict in the order of dict_keys, without building a key list on the heap.
+    export function dict_key_at(
+        ctx: Context<LCBase.ExplicitParams>,
+        source: CodeSource | undefined
+    ): ContextSet<ShValue> {
+        const params = ctx.retVal.params;
+        if (params.length !== 2) {
+            return ctx
+                .failWithMsg(
+                    `from 'LibCall.builtins.dict_key_at': got insufficient number of argument: ${params.length}`,
+                    source
+                )
+                .toSet();
+        }
+
+        const { heap } = ctx;
+        const dict = fetchAddr(params[0], heap);
+        const index = fetchAddr(params[1], heap);
+
+        if (dict?.type !== SVType.Object || index?.type !== SVType.Int) {
+            return ctx.warnWithMsg(`from 'LibCall.builtins.dict_key_at': invalid value type`, source).toSet();
+        }
+
+        const indexRng = ctx.getCachedRange(index.value)?.toIntRange();
+        if (!indexRng || !indexRng.isConst()) {
+            return ctx.warnWithMsg(`from 'LibCall.builtins.dict_key_at': index is not a constant`, source).toSet();
+        }
+
+        const idx = indexRng.start;
+        const keys = dictKeyList(dict);
+        if (idx >= 0 && idx < keys.length) {
+            return ctx.toSetWith(SVString.create(keys[idx], source));
+        }
+
+        return ctx.failWithMsg(`index out of range (indice: ${idx}, length: ${keys.length})`, source).toSet();
+    }
+
     // TODO: fix this to support non-string typed key
     export function dict_getitem(
         ctx: Context<LCBase.ExplicitParams>,
@@ -726,6 +866,86 @@ export namespace BuiltinsLCImpl {
         return ctx.toSetWith(SVBool.create(value.endsWith(testerVal), source));
     }
 
+    // python type name of a primitive value, for TypeError messages.
+    function pyTypeName(value: ShValue): string {
+        switch (value.type) {
+            case SVType.Int:
+                return 'int';
+            case SVType.Float:
+                return 'float';
+            case SVType.Bool:
+                return 'bool';
+            case SVType.None:
+                return 'NoneType';
+            default:
+                return 'object';
+        }
+    }
+
+    // sep.join(iterable) for list or tuple. joins whole items in a single call.
+    export function str_join(
+        ctx: Context<LCBase.ExplicitParams>,
+        source: CodeSource | undefined
+    ): ContextSet<ShValue> {
+        const params = ctx.retVal.params;
+        if (params.length !== 2) {
+            return ctx
+                .failWithMsg(
+                    `from 'LibCall.builtins.str_join': got insufficient number of argument: ${params.length}`,
+                    source
+                )
+                .toSet();
+        }
+
+        const { heap } = ctx;
+        const sep = fetchAddr(params[0], heap);
+        const iterable = fetchAddr(params[1], heap);
+
+        if (sep?.type !== SVType.String || iterable?.type !== SVType.Object) {
+            return ctx.warnWithMsg(`from 'LibCall.builtins.str_join': invalid value type`, source).toSet();
+        }
+
+        const lenVal = fetchAddr(iterable.getAttr('$length'), heap);
+        const lenRng = lenVal?.type === SVType.Int ? ctx.getCachedRange(lenVal.value)?.toIntRange() : undefined;
+        if (!lenRng || !lenRng.isConst()) {
+            return ctx
+                .addLog(`from 'LibCall.builtins.str_join': symbolic lengthed iterable. return symbolic string`, source)
+                .toSetWith(SVString.create(ExpString.fromSymbol(ctx.genSymString('str_join', source)), source));
+        }
+
+        const concat = (left: string | ExpString, right: string | ExpString): string | ExpString =>
+            typeof left === 'string' && typeof right === 'string'
+                ? left + right
+                : ExpString.concat(left, right, source);
+
+        let joined: string | ExpString = '';
+        for (let i = 0; i < lenRng.start; i++) {
+            const item = fetchAddr(iterable.getIndice(i), heap);
+            if (!item) {
+                return ctx.warnWithMsg(`from 'LibCall.builtins.str_join': cannot fetch item ${i}`, source).toSet();
+            }
+
+            // str.join does not convert its items. every item should be a string.
+            if (item.type !== SVType.String) {
+                return ctx
+                    .failWithMsg(
+                        `TypeError: sequence item ${i}: expected str instance, ${pyTypeName(item)} found`,
+                        source
+                    )
+                    .toSet();
+            }
+            const itemStr = item.value;
+
+            joined = i === 0 ? itemStr : concat(concat(joined, sep.value), itemStr);
+        }
+
+        if (typeof joined !== 'string') {
+            joined = ExpUtils.simplifyString(ctx.ctrSet, joined);
+        }
+
+        return ctx.toSetWith(SVString.create(joined, source));
+    }
+
     export function has_key(ctx: Context<LCBase.ExplicitParams>, source: CodeSource | undefined): ContextSet<ShValue> {
         const params = ctx.retVal.params;
         if (params.length !== 2) {
@@ -806,6 +1026,55 @@ export namespace BuiltinsLCImpl {
         return ctx.setHeap(newHeap).toSetWith(SVNone.create(undefined));
     }
 
+    // set positional values of namedtuple to its indices and field attributes at once.
+    export function namedtuple_setFields(
+        ctx: Context<LCBase.ExplicitParams>,
+        source: CodeSource | undefined
+    ): ContextSet<ShValue> {
+        const params = ctx.retVal.params;
+        if (params.length !== 3) {
+            return ctx
+                .failWithMsg(
+                    `from 'LibCall.builtins.namedtuple_setFields': got insufficient number of argument: ${params.length}`,
+                    source
+                )
+                .toSet();
+        }
+
+        const { heap } = ctx;
+        const self = fetchAddr(params[0], heap);
+        const nameList = fetchAddr(params[1], heap);
+        const args = fetchAddr(params[2], heap);
+
+        if (self?.type !== SVType.Object || nameList?.type !== SVType.Object || args?.type !== SVType.Object) {
+            return ctx.warnWithMsg(`from 'LibCall.builtins.namedtuple_setFields': invalid value type`, source).toSet();
+        }
+
+        const len = fetchAddr(args.getAttr('$length'), heap);
+        if (len?.type !== SVType.Int || typeof len.value !== 'number') {
+            return ctx
+                .warnWithMsg(
+                    `from 'LibCall.builtins.namedtuple_setFields': arguments do not have constant length`,
+                    source
+                )
+                .toSet();
+        }
+
+        let newSelf = self;
+        for (let i = 0; i < len.value; i++) {
+            const name = fetchAddr(nameList.getIndice(i), heap);
+            const value = args.getIndice(i);
+            if (name?.type !== SVType.String || typeof name.value !== 'string' || !value) {
+                return ctx
+                    .warnWithMsg(`from 'LibCall.builtins.namedtuple_setFields': invalid field at ${i}`, source)
+                    .toSet();
+            }
+            newSelf = newSelf.setIndice(i, value).setAttr(name.value, value);
+        }
+
+        return ctx.setHeap(heap.setVal(newSelf.addr, newSelf)).toSetWith(SVNone.create(source));
+    }
+
     export function len(ctx: Context<LCBase.ExplicitParams>, source: CodeSource | undefined): ContextSet<ShValue> {
         const params = ctx.retVal.params;
         if (params.length !== 1) {
@@ -857,8 +1126,46 @@ export namespace BuiltinsLCImpl {
                 .toSet();
         }
 
-        const heap = ctx.heap;
         const [a, b, prefixAddr] = params;
+        return genRandInt(ctx, a, b, prefixAddr, source).toSet();
+    }
+
+    // batched randInt: LibCall.builtins.randInts(a0, b0, prefix0, a1, b1, prefix1, ...)
+    // returns tuple of inclusive random integers (a_i <= retVal[i] <= b_i) in a single LibCall.
+    export function randInts(ctx: Context<LCBase.ExplicitParams>, source: CodeSource | undefined): ContextSet<ShValue> {
+        const params = ctx.retVal.params;
+        if (params.length === 0 || params.length % 3 !== 0) {
+            return ctx
+                .warnWithMsg(
+                    `from 'LibCall.builtins.randInts': got insufficient number of argument: ${params.length}`,
+                    source
+                )
+                .toSet();
+        }
+
+        let newCtx: Context<unknown> = ctx;
+        const values: ShValue[] = [];
+        for (let i = 0; i < params.length; i += 3) {
+            const numCtx = genRandInt(newCtx, params[i], params[i + 1], params[i + 2], source);
+            if (numCtx.retVal.type === SVType.Error) {
+                return numCtx.toSet();
+            }
+            values.push(numCtx.retVal);
+            newCtx = numCtx;
+        }
+
+        const [, tupleAddr, tupleCtx] = newCtx.genTuple(values, source);
+        return tupleCtx.toSetWith(tupleAddr);
+    }
+
+    function genRandInt<T>(
+        ctx: Context<T>,
+        a: ShValue,
+        b: ShValue,
+        prefixAddr: ShValue,
+        source: CodeSource | undefined
+    ): Context<ShValue> {
+        const heap = ctx.heap;
 
         const aVal = fetchAddr(a, heap);
         const bVal = fetchAddr(b, heap);
@@ -881,16 +1188,16 @@ export namespace BuiltinsLCImpl {
                     num = varRng.nextInt(range[0], range[1]);
                 }
 
-                return ctx.toSetWith(SVInt.create(num, source));
+                return ctx.setRetVal(SVInt.create(num, source));
             }
 
             if (range === null) {
                 num = ExpNum.fromSymbol(ctx.genSymInt(prefix, source));
-                return ctx.toSetWith(SVInt.create(num, source));
+                return ctx.setRetVal(SVInt.create(num, source));
             }
 
             if (typeof range === 'number') {
-                return ctx.toSetWith(SVInt.create(range, source));
+                return ctx.setRetVal(SVInt.create(range, source));
             } else {
                 let symCtx: Context<unknown> = ctx;
                 if (typeof range[0] === 'number') {
@@ -907,27 +1214,27 @@ export namespace BuiltinsLCImpl {
                     num = ExpNum.fromSymbol(ctx.genSymInt(prefix, source));
                 }
 
-                return symCtx.toSetWith(SVInt.create(num, source));
+                return symCtx.setRetVal(SVInt.create(num, source));
             }
         }
 
         if (!(aVal?.type === SVType.Int || aVal?.type === SVType.Float)) {
-            return ctx.warnWithMsg(`from 'LibCall.builtins.randInt: value a is non-numeric`, source).toSet();
+            return ctx.warnWithMsg(`from 'LibCall.builtins.randInt: value a is non-numeric`, source);
         }
         if (!(bVal?.type === SVType.Int || bVal?.type === SVType.Float)) {
-            return ctx.warnWithMsg(`from 'LibCall.builtins.randInt: value b is non-numeric`, source).toSet();
+            return ctx.warnWithMsg(`from 'LibCall.builtins.randInt: value b is non-numeric`, source);
         }
 
         if (varRng && typeof aVal.value === 'number' && typeof bVal.value === 'number') {
             const num = varRng.nextInt(aVal.value, bVal.value);
-            return ctx.toSetWith(SVInt.create(num, source));
+            return ctx.setRetVal(SVInt.create(num, source));
         }
 
         let symCtx = ctx.genIntGte(prefix, aVal.value, source);
         const num = symCtx.retVal;
         symCtx = symCtx.guarantee(symCtx.genLte(num, bVal.value, source));
 
-        return symCtx.toSetWith(SVInt.create(num, source));
+        return symCtx.setRetVal(SVInt.create(num, source));
     }
 
     // exclusive randfloat (a <= retVal < b)
@@ -1148,6 +1455,255 @@ export namespace BuiltinsLCImpl {
         return ctx.toSetWith(item);
     }
 
+    // x + y of lists or tuples. result has the same kind with x.
+    // if the length of x or y is symbolic, result has the summed length and keeps the items that can be placed.
+    // returns SVNone if an item cannot be fetched; caller should fall back to list_append.
+    export function concat(ctx: Context<LCBase.ExplicitParams>, source: CodeSource | undefined): ContextSet<ShValue> {
+        const params = ctx.retVal.params;
+        if (params.length !== 2) {
+            return ctx
+                .warnWithMsg(
+                    `from 'LibCall.builtins.concat': got insufficient number of argument: ${params.length}`,
+                    source
+                )
+                .toSet();
+        }
+
+        const { env, heap } = ctx;
+        const left = fetchAddr(params[0], heap);
+        const right = fetchAddr(params[1], heap);
+
+        if (left?.type !== SVType.Object || right?.type !== SVType.Object) {
+            return ctx.warnWithMsg(`from 'LibCall.builtins.concat': invalid value type`, source).toSet();
+        }
+
+        const lengths: (number | ExpNum)[] = [];
+        for (const obj of [left, right]) {
+            const objLen = fetchAddr(obj.getAttr('$length'), heap);
+            if (objLen?.type !== SVType.Int) {
+                return ctx.toSetWith(SVNone.create(source));
+            }
+            const lenRng = ctx.getCachedRange(objLen.value)?.toIntRange();
+            lengths.push(lenRng?.isConst() ? lenRng.start : objLen.value);
+        }
+
+        const [leftLen, rightLen] = lengths;
+        const values: ShValue[] = [];
+        for (const [obj, objLen] of [
+            [left, leftLen],
+            [right, rightLen],
+        ] as [SVObject, number | ExpNum][]) {
+            // items after a symbolic lengthed operand cannot be placed.
+            if (typeof objLen !== 'number') break;
+
+            for (let i = 0; i < objLen; i++) {
+                const item = obj.getIndice(i);
+                if (!item) {
+                    return ctx.toSetWith(SVNone.create(source));
+                }
+                values.push(item);
+            }
+        }
+
+        const isTuple = isInstanceOf(left, env.getId('tuple')!, env, heap);
+        const [, resultAddr, newCtx] = isTuple ? ctx.genTuple(values, source) : ctx.genList(values, source);
+        if (typeof leftLen === 'number' && typeof rightLen === 'number') {
+            return newCtx.toSetWith(resultAddr);
+        }
+
+        // symbolic lengthed operands. the result keeps the known items and has the summed length.
+        const sumLen = simplifyNum(newCtx.ctrSet, ExpNum.bop(NumBopType.Add, leftLen, rightLen, source));
+        const result = fetchAddr(resultAddr, newCtx.heap) as SVObject;
+        const resultObj = result.setAttr('$length', SVInt.create(sumLen, source));
+        return newCtx.setHeap(newCtx.heap.setVal(resultAddr, resultObj)).toSetWith(resultAddr);
+    }
+
+    // compare two values without calling __eq__. undefined if it cannot be decided statically.
+    function staticEquals(left: ShValue, right: ShValue): boolean | undefined {
+        if (left.type === SVType.Object || right.type === SVType.Object) {
+            // identical object is equal to itself. otherwise, it depends on __eq__
+            return left.type === SVType.Object && right.type === SVType.Object && left.addr === right.addr
+                ? true
+                : undefined;
+        }
+
+        switch (left.type) {
+            case SVType.None:
+                return right.type === SVType.None;
+            case SVType.Int:
+            case SVType.Float:
+            case SVType.Bool:
+            case SVType.String:
+                if (right.type === SVType.None) return false;
+                break;
+            default:
+                return;
+        }
+
+        if (typeof left.value === 'object' || !('value' in right) || typeof right.value === 'object') {
+            return;
+        }
+
+        if ((left.type === SVType.String) !== (right.type === SVType.String)) {
+            return false;
+        }
+
+        // python compares bool, int and float numerically (True == 1 == 1.0)
+        return left.type === SVType.String ? left.value === right.value : Number(left.value) === Number(right.value);
+    }
+
+    // list.index(x, start, end) with constant bounds. returns -1 if x is not in the range.
+    // returns SVNone if some item cannot be compared statically; caller should fall back to __eq__.
+    export function list_index(
+        ctx: Context<LCBase.ExplicitParams>,
+        source: CodeSource | undefined
+    ): ContextSet<ShValue> {
+        const params = ctx.retVal.params;
+        if (params.length !== 4) {
+            return ctx
+                .warnWithMsg(
+                    `from 'LibCall.builtins.list_index': got insufficient number of argument: ${params.length}`,
+                    source
+                )
+                .toSet();
+        }
+
+        const { heap } = ctx;
+        const [listAddr, valueAddr, startAddr, endAddr] = params;
+
+        const list = fetchAddr(listAddr, heap);
+        const value = fetchAddr(valueAddr, heap);
+        const start = fetchAddr(startAddr, heap);
+        const end = fetchAddr(endAddr, heap);
+
+        if (list?.type !== SVType.Object || !value) {
+            return ctx.warnWithMsg(`from 'LibCall.builtins.list_index': invalid value type`, source).toSet();
+        }
+
+        const startRng = start?.type === SVType.Int ? ctx.getCachedRange(start.value)?.toIntRange() : undefined;
+        const endRng = end?.type === SVType.Int ? ctx.getCachedRange(end.value)?.toIntRange() : undefined;
+        if (!startRng || !startRng.isConst() || !endRng || !endRng.isConst()) {
+            return ctx.toSetWith(SVNone.create(source));
+        }
+
+        for (let i = startRng.start; i < endRng.start; i++) {
+            const item = fetchAddr(list.getIndice(i), heap);
+            const isEqual = item ? staticEquals(item, value) : undefined;
+            if (isEqual === undefined) {
+                return ctx.toSetWith(SVNone.create(source));
+            } else if (isEqual) {
+                return ctx.toSetWith(SVInt.create(i, source));
+            }
+        }
+
+        return ctx.toSetWith(SVInt.create(-1, source));
+    }
+
+    // value in list (or tuple) of constant length.
+    // returns SVNone if some item cannot be compared statically; caller should fall back to __eq__.
+    export function list_contains(
+        ctx: Context<LCBase.ExplicitParams>,
+        source: CodeSource | undefined
+    ): ContextSet<ShValue> {
+        const params = ctx.retVal.params;
+        if (params.length !== 2) {
+            return ctx
+                .warnWithMsg(
+                    `from 'LibCall.builtins.list_contains': got insufficient number of argument: ${params.length}`,
+                    source
+                )
+                .toSet();
+        }
+
+        const { heap } = ctx;
+        const list = fetchAddr(params[0], heap);
+        const value = fetchAddr(params[1], heap);
+
+        if (list?.type !== SVType.Object || !value) {
+            return ctx.warnWithMsg(`from 'LibCall.builtins.list_contains': invalid value type`, source).toSet();
+        }
+
+        const len = fetchAddr(list.getAttr('$length'), heap);
+        const lenRng = len?.type === SVType.Int ? ctx.getCachedRange(len.value)?.toIntRange() : undefined;
+        if (!lenRng || !lenRng.isConst()) {
+            return ctx.toSetWith(SVNone.create(source));
+        }
+
+        for (let i = 0; i < lenRng.start; i++) {
+            const item = fetchAddr(list.getIndice(i), heap);
+            const isEqual = item ? staticEquals(item, value) : undefined;
+            if (isEqual === undefined) {
+                return ctx.toSetWith(SVNone.create(source));
+            } else if (isEqual) {
+                return ctx.toSetWith(SVBool.create(true, source));
+            }
+        }
+
+        return ctx.toSetWith(SVBool.create(false, source));
+    }
+
+    // obj[start:stop:step] of list or tuple with constant bounds. returns new list (or tuple) in a single call.
+    export function sliceRange(
+        ctx: Context<LCBase.ExplicitParams>,
+        source: CodeSource | undefined
+    ): ContextSet<ShValue> {
+        const params = ctx.retVal.params;
+        if (params.length !== 4) {
+            return ctx
+                .warnWithMsg(
+                    `from 'LibCall.builtins.sliceRange': got insufficient number of argument: ${params.length}`,
+                    source
+                )
+                .toSet();
+        }
+
+        const { env, heap } = ctx;
+        const [objAddr, startAddr, stopAddr, stepAddr] = params;
+
+        const obj = fetchAddr(objAddr, heap);
+        if (obj?.type !== SVType.Object) {
+            return ctx.warnWithMsg(`from 'LibCall.builtins.sliceRange': got non-object`, source).toSet();
+        }
+
+        const toConst = (value: ShValue | undefined): number | undefined => {
+            const intVal = fetchAddr(value, heap);
+            if (intVal?.type !== SVType.Int) return;
+            const rng = ctx.getCachedRange(intVal.value)?.toIntRange();
+            return rng?.isConst() ? rng.start : undefined;
+        };
+
+        // bounds are already resolved by the caller. return None on symbolic bounds,
+        // so that the caller can fall back to slicing item by item.
+        let start = toConst(startAddr);
+        let stop = toConst(stopAddr);
+        const step = fetchAddr(stepAddr, heap)?.type === SVType.None ? 1 : toConst(stepAddr);
+        if (start === undefined || stop === undefined || !step) {
+            return ctx.toSetWith(SVNone.create(source));
+        }
+
+        // clamp bounds like python if the length is known.
+        const objLen = toConst(obj.getAttr('$length'));
+        if (objLen !== undefined) {
+            const [lo, hi] = step > 0 ? [0, objLen] : [-1, objLen - 1];
+            start = Math.min(Math.max(start, lo), hi);
+            stop = Math.min(Math.max(stop, lo), hi);
+        }
+
+        const values: ShValue[] = [];
+        for (let i = start; step > 0 ? i < stop : i > stop; i += step) {
+            const item = obj.getIndice(i);
+            if (!item) {
+                const lengthStr = objLen === undefined ? 'unknown' : objLen.toString();
+                return ctx.failWithMsg(`index out of range (indice: ${i}, length: ${lengthStr})`, source).toSet();
+            }
+            values.push(item);
+        }
+
+        const isTuple = isInstanceOf(obj, env.getId('tuple')!, env, heap);
+        const [, sliced, newCtx] = isTuple ? ctx.genTuple(values, source) : ctx.genList(values, source);
+        return newCtx.toSetWith(sliced);
+    }
+
     // clone object (shallow-clone)
     export function clone(ctx: Context<LCBase.ExplicitParams>, source: CodeSource | undefined): ContextSet<ShValue> {
         const params = ctx.retVal.params;
@@ -1244,6 +1800,76 @@ export namespace BuiltinsLCImpl {
         return ctx.setRetVal(SVBool.create(call?.type === SVType.Func, source)).toSet();
     }
 
+    // check that `name` is reachable from `value` by a single walk of its own attrs and MRO.
+    // objects with `__getattr__` are treated as having every attribute.
+    function probeAttr<T>(ctx: Context<T>, value: ShValue, name: string): boolean {
+        const { env, heap } = ctx;
+        const obj = fetchAddr(value, heap);
+
+        if (obj?.type === SVType.Object && (obj.attrs.has(name) || obj.attrs.has('__getattr__'))) {
+            return true;
+        }
+
+        for (const classAddr of trackMro(value, heap, env)) {
+            if (classAddr === undefined) continue;
+            const classObj = fetchAddr(heap.getVal(classAddr), heap);
+            if (classObj?.type === SVType.Object && (classObj.attrs.has(name) || classObj.attrs.has('__getattr__'))) {
+                return true;
+            }
+        }
+
+        return false;
+    }
+
+    // getattr(object, name[, default]): lookup attribute once. if `default` is given, return it without warning
+    // when the attribute is not found.
+    export function getAttr(ctx: Context<LCBase.ExplicitParams>, source: CodeSource | undefined): ContextSet<ShValue> {
+        const params = ctx.retVal.params;
+        if (params.length !== 2 && params.length !== 3) {
+            return ctx
+                .warnWithMsg(
+                    `from 'LibCall.builtins.getAttr': got insufficient number of argument: ${params.length}`,
+                    source
+                )
+                .toSet();
+        }
+
+        const [objAddr, nameAddr, defaultAddr] = params;
+        const name = fetchAddr(nameAddr, ctx.heap);
+
+        if (name?.type !== SVType.String || typeof name.value !== 'string') {
+            return ctx.warnWithMsg(`from 'LibCall.builtins.getAttr': attribute is not a constant`, source).toSet();
+        }
+
+        if (defaultAddr !== undefined && !probeAttr(ctx, objAddr, name.value)) {
+            return ctx.toSetWith(defaultAddr);
+        }
+
+        return ctx.getAttrDeep(objAddr, name.value, source);
+    }
+
+    // hasattr(object, name): same lookup with getAttr, but never raises nor warns.
+    export function hasAttr(ctx: Context<LCBase.ExplicitParams>, source: CodeSource | undefined): ContextSet<ShValue> {
+        const params = ctx.retVal.params;
+        if (params.length !== 2) {
+            return ctx
+                .warnWithMsg(
+                    `from 'LibCall.builtins.hasAttr': got insufficient number of argument: ${params.length}`,
+                    source
+                )
+                .toSet();
+        }
+
+        const [objAddr, nameAddr] = params;
+        const name = fetchAddr(nameAddr, ctx.heap);
+
+        if (name?.type !== SVType.String || typeof name.value !== 'string') {
+            return ctx.warnWithMsg(`from 'LibCall.builtins.hasAttr': attribute is not a constant`, source).toSet();
+        }
+
+        return ctx.toSetWith(SVBool.create(probeAttr(ctx, objAddr, name.value), source));
+    }
+
     export function time(ctx: Context<LCBase.ExplicitParams>, source: CodeSource | undefined): ContextSet<ShValue> {
         return ctx.toSetWith(SVFloat.create(Date.now() / 1000.0, source));
     }
@@ -1317,22 +1943,34 @@ export namespace BuiltinsLCImpl {
         dict_values,
         dict_getitem,
         dict_setitem,
+        dict_merge,
+        dict_size,
+        dict_key_at,
         dict_pop,
         str_islower,
         str_startswith,
         str_endswith,
+        str_join,
         namedtuple_pushField,
+        namedtuple_setFields,
         has_key,
         len,
         randInt,
+        randInts,
         randFloat,
         exit,
         warn,
         clone,
         setAttr,
+        getAttr,
+        hasAttr,
         setIndice,
         setSize,
         getItemByIndex,
+        sliceRange,
+        list_index,
+        list_contains,
+        concat,
         callable,
         box,
         time,
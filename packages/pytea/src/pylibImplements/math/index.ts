@@ -2,8 +2,9 @@ import { TorchBackend } from 'src/backend/torchBackend';
 
 import { fetchAddr } from '../../backend/backUtils';
 import { Context, ContextSet } from '../../backend/context';
-import { CodeSource, ShValue, SVFloat, SVInt, SVType, svTypeToString } from '../../backend/sharpValues';
-import { ExpNum, NumUopType } from '../../backend/symExpressions';
+import { simplifyNum } from '../../backend/expUtils';
+import { CodeSource, ShValue, SVFloat, SVInt, SVNone, SVType, svTypeToString } from '../../backend/sharpValues';
+import { ExpNum, NumBopType, NumUopType } from '../../backend/symExpressions';
 import { LCImpl } from '..';
 import { LCBase } from '../libcall';
 
@@ -241,11 +242,101 @@ export namespace MathLCImpl {
         }
     }
 
+    // max(0, num) as a single expression instead of a branch.
+    export function clamp_nonneg(
+        ctx: Context<LCBase.ExplicitParams>,
+        source: CodeSource | undefined
+    ): ContextSet<ShValue> {
+        const params = ctx.retVal.params;
+        if (params.length !== 1) {
+            return ctx
+                .warnWithMsg(
+                    `from 'LibCall.math.clamp_nonneg': got insufficient number of argument: ${params.length}`,
+                    source
+                )
+                .toSet();
+        }
+
+        const num = fetchAddr(params[0], ctx.heap);
+
+        if (num?.type !== SVType.Int && num?.type !== SVType.Float) {
+            return ctx.warnWithMsg(`from 'LibCall.math.clamp_nonneg': got non-numeric value`, source).toSet();
+        }
+
+        const numExp = num.value;
+        if (typeof numExp === 'number') {
+            return ctx.toSetWith(numExp >= 0 ? num : SVInt.create(0, source));
+        }
+
+        const numRng = ctx.getCachedRange(numExp);
+        if (numRng?.gte(0)) {
+            return ctx.toSetWith(num);
+        } else if (numRng?.lte(0)) {
+            return ctx.toSetWith(SVInt.create(0, source));
+        }
+
+        const exp = simplifyNum(ctx.ctrSet, ExpNum.max([0, numExp], source));
+        return ctx.toSetWith(num.type === SVType.Int ? SVInt.create(exp, source) : SVFloat.create(exp, source));
+    }
+
+    // sum of a constant lengthed list or tuple of numbers as a single expression.
+    // returns SVNone if it has non-numeric item or symbolic length; caller should fall back to __add__ loop.
+    export function sum(ctx: Context<LCBase.ExplicitParams>, source: CodeSource | undefined): ContextSet<ShValue> {
+        const params = ctx.retVal.params;
+        if (params.length !== 1) {
+            return ctx
+                .warnWithMsg(`from 'LibCall.math.sum': got insufficient number of argument: ${params.length}`, source)
+                .toSet();
+        }
+
+        const heap = ctx.heap;
+        const values = fetchAddr(params[0], heap);
+
+        if (values?.type !== SVType.Object) {
+            return ctx.toSetWith(SVNone.create(source));
+        }
+
+        const len = fetchAddr(values.getAttr('$length'), heap);
+        const lenRng = len?.type === SVType.Int ? ctx.getCachedRange(len.value)?.toIntRange() : undefined;
+        if (!lenRng || !lenRng.isConst()) {
+            return ctx.toSetWith(SVNone.create(source));
+        }
+
+        // constant terms are folded first, then symbolic terms are chained.
+        let constSum = 0;
+        let symSum: ExpNum | undefined;
+        let isFloat = false;
+        for (let i = 0; i < lenRng.start; i++) {
+            const item = fetchAddr(values.getIndice(i), heap);
+            if (item?.type !== SVType.Int && item?.type !== SVType.Float) {
+                return ctx.toSetWith(SVNone.create(source));
+            }
+
+            isFloat = isFloat || item.type === SVType.Float;
+            const itemExp = item.value;
+            if (typeof itemExp === 'number') {
+                constSum += itemExp;
+            } else {
+                symSum = symSum ? ExpNum.bop(NumBopType.Add, symSum, itemExp, source) : itemExp;
+            }
+        }
+
+        let result: number | ExpNum = constSum;
+        if (symSum) {
+            const sumExp = constSum === 0 ? symSum : ExpNum.bop(NumBopType.Add, symSum, constSum, source);
+            result = simplifyNum(ctx.ctrSet, sumExp);
+        }
+
+        return ctx.toSetWith(isFloat ? SVFloat.create(result, source) : SVInt.create(result, source));
+    }
+
     export const libCallImpls: { [key: string]: LCImpl } = {
         floor,
         ceil,
         abs,
         float_fun,
+        clamp_nonneg,
+        sum,
     };
 }
 
@@ -57,7 +57,23 @@ export namespace NumpyLCImpl {
         // ndarrayInit is always used in ndarray.__init__ -> force casting
         const addr = selfAddr as SVAddr;
         const self = fetchAddr(selfAddr, heap)! as SVObject;
-        const shapeSV = fetchAddr(shapeAddr as SVAddr, heap)! as SVObject;
+        const shapeSV = fetchAddr(shapeAddr, heap);
+
+        // if args is an integer, it is the length of a 1-D array. (e.g. np.zeros(3))
+        if (shapeSV?.type === SVType.Int) {
+            const dim = shapeSV.value;
+            return ctx
+                .require(
+                    ctx.genLte(0, dim, source),
+                    `from 'LibCall.numpy.ndarrayInit': negative dimensions are not allowed`,
+                    source
+                )
+                .map((ctx) => {
+                    const size = SVSize.createSize(ctx, ExpShape.fromConst(1, [dim], source), source);
+                    const newHeap = ctx.heap.setVal(addr, self.setAttr('shape', size));
+                    return ctx.setHeap(newHeap).setRetVal(SVNone.create());
+                });
+        }
 
         // if args is object that has 'shape'
         if (shapeSV?.type === SVType.Object) {
@@ -73,7 +89,7 @@ export namespace NumpyLCImpl {
         }
 
         // if args is list of integer
-        return ctx.parseSize(shapeSV, source).map((ctx) => {
+        return ctx.parseSize(shapeSV!, source).map((ctx) => {
             let shape: ExpShape;
             let newCtx: Context<any> = ctx;
             if (typeof ctx.retVal === 'string') {
@@ -150,10 +166,16 @@ export namespace NumpyLCImpl {
         return ctx.shBroadcast(leftShape, rightShape, source).flatMap((ctx) => genNdarray(ctx, ctx.retVal, source));
     }
 
-    // A replica of torch.matmul() in torch/index.ts
+    // matmul(x1, x2, dtype, out?): the result is created with `dtype`, and `out` is checked in the same call.
     export function matmul(ctx: Context<LCBase.ExplicitParams>, source: CodeSource | undefined): ContextSet<ShValue> {
+        const [newCtx, out] = splitOut(ctx, 4);
+        return checkOut(matmulImpl(newCtx, source), out, 'matmul', source);
+    }
+
+    // A replica of torch.matmul() in torch/index.ts
+    function matmulImpl(ctx: Context<LCBase.ExplicitParams>, source: CodeSource | undefined): ContextSet<ShValue> {
         const params = ctx.retVal.params;
-        if (params.length !== 2) {
+        if (params.length !== 3) {
             return warnNdarrayWithMsg(
                 ctx,
                 `from 'LibCall.numpy.matmul': got insufficient number of argument: ${params.length}`,
@@ -162,7 +184,7 @@ export namespace NumpyLCImpl {
         }
 
         const heap = ctx.heap;
-        const [leftAddr, rightAddr] = params;
+        const [leftAddr, rightAddr, dtypeAddr] = params;
 
         const leftSize = fetchSize(leftAddr, heap);
         const rightSize = fetchSize(rightAddr, heap);
@@ -205,7 +227,7 @@ export namespace NumpyLCImpl {
                                 source
                             );
                         })
-                        .flatMap((ctx) => genNdarray(ctx, ExpShape.fromConst(0, [], source), source));
+                        .flatMap((ctx) => genNdarray(ctx, ExpShape.fromConst(0, [], source), source, dtypeAddr));
 
                     const rightAxis = ExpNum.bop(NumBopType.Sub, rightRank, 2, source);
                     const lr12 = rightTwoPath
@@ -222,7 +244,7 @@ export namespace NumpyLCImpl {
                             );
                         })
                         .flatMap((ctx) => ctx.shReduce(rightShape, rightAxis, source))
-                        .flatMap((ctx) => genNdarray(ctx, ctx.retVal, source));
+                        .flatMap((ctx) => genNdarray(ctx, ctx.retVal, source, dtypeAddr));
 
                     return lr11.join(lr12);
                 });
@@ -246,11 +268,11 @@ export namespace NumpyLCImpl {
                             );
                         })
                         .flatMap((ctx) => ctx.shReduce(leftShape, leftAxis, source))
-                        .flatMap((ctx) => genNdarray(ctx, ctx.retVal, source));
+                        .flatMap((ctx) => genNdarray(ctx, ctx.retVal, source, dtypeAddr));
 
                     const lr22 = rightTwoPath
                         .flatMap((ctx) => ctx.shMatmul(leftShape, rightShape, source))
-                        .flatMap((ctx) => genNdarray(ctx, ctx.retVal, source));
+                        .flatMap((ctx) => genNdarray(ctx, ctx.retVal, source, dtypeAddr));
 
                     return lr21.join(lr22);
                 });
@@ -306,14 +328,23 @@ export namespace NumpyLCImpl {
         return ctx.setHeap(newHeap).toSetWith(newArr);
     }
 
+    // concatenate(seq, axis, dtype, out?): the result is created with `dtype`, and `out` is checked in the same call.
+    export function concatenate(
+        ctx: Context<LCBase.ExplicitParams>,
+        source: CodeSource | undefined
+    ): ContextSet<ShValue> {
+        const [newCtx, out] = splitOut(ctx, 4);
+        return checkOut(concatenateImpl(newCtx, source), out, 'concatenate', source);
+    }
+
     // Assumption: "tensors" is a constantRanked sequence, and each element is available.
     // TODO: handle empty tensor.
-    export function concatenate(
+    function concatenateImpl(
         ctx: Context<LCBase.ExplicitParams>,
         source: CodeSource | undefined
     ): ContextSet<ShValue> {
         const params = ctx.retVal.params;
-        if (params.length !== 2) {
+        if (params.length !== 3) {
             return ctx
                 .warnWithMsg(
                     `from 'LibCall.numpy.concatenate': got insufficient number of argument: ${params.length}`,
@@ -323,7 +354,7 @@ export namespace NumpyLCImpl {
         }
 
         const heap = ctx.heap;
-        const [seqAddr, axisAddr] = params;
+        const [seqAddr, axisAddr, dtypeAddr] = params;
 
         const seq = fetchAddr(seqAddr, heap);
         const axisSV = fetchAddr(axisAddr, heap);
@@ -390,7 +421,7 @@ export namespace NumpyLCImpl {
         return ctx
             .require(ctrs, `from 'LibCall.numpy.concatenate': shapes must match, axis must be within rank`, source)
             .flatMap((ctx) => {
-                return genNdarray(ctx, returnShape, source);
+                return genNdarray(ctx, returnShape, source, dtypeAddr);
             });
     }
 
@@ -429,7 +460,13 @@ export namespace NumpyLCImpl {
             .return(SVNone.create(source));
     }
 
+    // reduce(self, axis, keepdims, out?): `out` is checked in the same call.
     export function reduce(ctx: Context<LCBase.ExplicitParams>, source: CodeSource | undefined): ContextSet<ShValue> {
+        const [newCtx, out] = splitOut(ctx, 4);
+        return checkOut(reduceImpl(newCtx, source), out, 'reduce', source);
+    }
+
+    function reduceImpl(ctx: Context<LCBase.ExplicitParams>, source: CodeSource | undefined): ContextSet<ShValue> {
         const params = ctx.retVal.params;
         if (params.length !== 3) {
             return warnNdarrayWithMsg(
@@ -617,10 +654,60 @@ export namespace NumpyLCImpl {
         return genNdarray(ctx, returnShape, source);
     }
 
-    function genNdarray<T>(ctx: Context<T>, shape: ExpShape, source: CodeSource | undefined): ContextSet<ShValue> {
+    // pops optional trailing `out` parameter of LibCalls that take `arity` parameters with it.
+    function splitOut(
+        ctx: Context<LCBase.ExplicitParams>,
+        arity: number
+    ): [Context<LCBase.ExplicitParams>, ShValue | undefined] {
+        const params = ctx.retVal.params;
+        if (params.length !== arity) {
+            return [ctx, undefined];
+        }
+        return [ctx.setRetVal({ params: params.slice(0, arity - 1) }), params[arity - 1]];
+    }
+
+    // same as copyOut, but applied to every result of `ctxSet` without another LibCall round-trip.
+    function checkOut(
+        ctxSet: ContextSet<ShValue>,
+        outAddr: ShValue | undefined,
+        name: string,
+        source: CodeSource | undefined
+    ): ContextSet<ShValue> {
+        if (outAddr === undefined || outAddr.type === SVType.None) {
+            return ctxSet;
+        }
+
+        return ctxSet.flatMap((ctx) => {
+            const array = fetchSize(ctx.retVal, ctx.heap);
+            const out = fetchSize(outAddr, ctx.heap);
+            if (typeof array === 'string') {
+                return ctx.warnWithMsg(`from 'LibCall.numpy.${name}': ${array}`, source).toSet();
+            }
+            if (typeof out === 'string') {
+                return ctx.warnWithMsg(`from 'LibCall.numpy.${name}': ${out}`, source).toSet();
+            }
+
+            return ctx
+                .require(
+                    ctx.genEq(array.shape, out.shape, source),
+                    `from 'LibCall.numpy.${name}': shapes must be equal`,
+                    source
+                )
+                .return(ctx.retVal);
+        });
+    }
+
+    // if `dtype` is given, it is passed to ndarray.__init__ instead of being assigned afterwards.
+    function genNdarray<T>(
+        ctx: Context<T>,
+        shape: ExpShape,
+        source: CodeSource | undefined,
+        dtype?: ShValue
+    ): ContextSet<ShValue> {
         const newShape = simplifyShape(ctx.ctrSet, shape);
+        const size = SVSize.createSize(ctx, newShape, source);
 
-        return TorchBackend.libClassInit(ctx, 'numpy.ndarray', [SVSize.createSize(ctx, newShape, source)], source);
+        return TorchBackend.libClassInit(ctx, 'numpy.ndarray', dtype ? [size, dtype] : [size], source);
     }
 
     // return tuple of ExpNums from SVObject.
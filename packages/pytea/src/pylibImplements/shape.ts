@@ -67,6 +67,47 @@ export namespace ShapeLCImpl {
         return posPath.join(negPath);
     }
 
+    // get (tensor, axis, dim). returns new tensor whose `axis`-th dimension is replaced by dim.
+    // same shape as reducing `axis + 1` of repeat(tensor, axis, dim), without the intermediate tensor.
+    export function setDim(ctx: Context<LCBase.ExplicitParams>, source: CodeSource | undefined): ContextSet<ShValue> {
+        const params = ctx.retVal.params;
+        if (params.length !== 3) {
+            return ctx.warnTensorWithMsg(
+                `from 'LibCall.shape.setDim': got insufficient number of argument: ${params.length}`,
+                source
+            );
+        }
+
+        const heap = ctx.heap;
+        const [tensorAddr, axisAddr, dimAddr] = params;
+
+        const tensorSize = fetchSize(tensorAddr, heap);
+        const axis = fetchAddr(axisAddr, heap);
+        const dim = fetchAddr(dimAddr, heap);
+
+        if (typeof tensorSize === 'string') {
+            return ctx.warnTensorWithMsg(`from 'LibCall.shape.setDim: ${tensorSize}`, source);
+        }
+        if (axis?.type !== SVType.Int) {
+            return ctx.warnTensorWithMsg(`from 'LibCall.shape.setDim: axis value is not an integer`, source);
+        } else if (dim?.type !== SVType.Int) {
+            return ctx.warnTensorWithMsg(`from 'LibCall.shape.setDim: dim value is not an integer`, source);
+        }
+
+        const shape = tensorSize.shape;
+        const rank = ExpShape.getRank(shape);
+        const axisVal = axis.value;
+        const dimVal = dim.value;
+
+        return ctx
+            .require(
+                [ctx.genLte(0, axisVal, source), ctx.genLt(axisVal, rank, source), ctx.genLte(0, dimVal, source)],
+                `from 'LibCall.shape.setDim': axis out of range or negative dim`,
+                source
+            )
+            .flatMap((ctx) => genTensor(ctx, ExpShape.setDim(shape, axisVal, dimVal, source), source));
+    }
+
     export function size_getitem(
         ctx: Context<LCBase.ExplicitParams>,
         source: CodeSource | undefined
@@ -270,6 +311,53 @@ export namespace ShapeLCImpl {
             .toSet();
     }
 
+    // tensorGetItems(size, indices): apply tensorGetItem for each index of the tuple `indices`.
+    // axes are reduced from the last to the first, so that the remaining axis numbers are not shifted.
+    export function tensorGetItems(
+        ctx: Context<LCBase.ExplicitParams>,
+        source: CodeSource | undefined
+    ): ContextSet<ShValue> {
+        const params = ctx.retVal.params;
+        if (params.length !== 2) {
+            return ctx.warnTensorWithMsg(
+                `from 'LibCall.shape.tensorGetItems': got insufficient number of argument: ${params.length}`,
+                source
+            );
+        }
+
+        const heap = ctx.heap;
+        const [sizeAddr, indicesAddr] = params;
+
+        const indices = fetchAddr(indicesAddr, heap);
+        if (indices?.type !== SVType.Object) {
+            return ctx.warnWithMsg(`from 'LibCall.shape.tensorGetItems': indices is not a tuple`, source).toSet();
+        }
+
+        const length = fetchAddr(indices.getAttr('$length'), heap);
+        if (length?.type !== SVType.Int || typeof length.value !== 'number') {
+            return ctx
+                .warnWithMsg(`from 'LibCall.shape.tensorGetItems': length of indices is not a constant`, source)
+                .toSet();
+        }
+
+        let ctxSet: ContextSet<ShValue> = ctx.toSetWith(sizeAddr);
+        for (let axis = length.value - 1; axis >= 0; axis--) {
+            const index = indices.getIndice(axis);
+            if (index === undefined) {
+                return ctx
+                    .warnWithMsg(`from 'LibCall.shape.tensorGetItems': index ${axis} is undefined`, source)
+                    .toSet();
+            }
+
+            const axisValue = SVInt.create(axis, source);
+            ctxSet = ctxSet.flatMap((ctx) =>
+                tensorGetItem(ctx.setRetVal({ params: [ctx.retVal, axisValue, index] }), source)
+            );
+        }
+
+        return ctxSet;
+    }
+
     // shapeConcat(T[1, 2, 3], T[4, 5, 6], obj):
     //     set size of 'obj' to be T[1, 2, 3, 4, 5, 6].
     export function shapeConcat(
@@ -414,9 +502,11 @@ export namespace ShapeLCImpl {
 
     export const libCallImpls: { [key: string]: LCImpl } = {
         repeat,
+        setDim,
         size_getitem,
         size_len,
         tensorGetItem,
+        tensorGetItems,
         shapeConcat,
         extractShape,
         randShape,
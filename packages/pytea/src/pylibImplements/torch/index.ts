@@ -129,6 +129,51 @@ export namespace TorchLCImpl {
         return genTensor(ctx, ExpShape.fromConst(0, [], source), source);
     }
 
+    // tensor of `size` for factories like torch.zeros, without going through Tensor.__init__.
+    // `size` is either a sequence of dimensions or a tuple wrapping a single sequence or torch.Size.
+    export function sizedTensor(
+        ctx: Context<LCBase.ExplicitParams>,
+        source: CodeSource | undefined
+    ): ContextSet<ShValue> {
+        const params = ctx.retVal.params;
+        if (params.length !== 2) {
+            return ctx.warnTensorWithMsg(
+                `from 'LibCall.torch.sizedTensor': got insufficient number of argument: ${params.length}`,
+                source
+            );
+        }
+
+        const heap = ctx.heap;
+        const [sizeAddr, dtypeAddr] = params;
+        const dtype = dtypeAddr.type === SVType.None ? undefined : dtypeAddr;
+
+        let size = fetchAddr(sizeAddr, heap);
+        if (size?.type !== SVType.Object) {
+            return ctx.warnTensorWithMsg(`from 'LibCall.torch.sizedTensor': size is not iterable`, source);
+        }
+
+        // e.g. torch.zeros((2, 3)) or torch.zeros(x.size())
+        const length = fetchAddr(size.getAttr('$length'), heap);
+        if (length?.type === SVType.Int && length.value === 1) {
+            const first = fetchAddr(size.getIndice(0), heap);
+            if (first?.type === SVType.Object) {
+                size = first;
+            }
+        }
+
+        if (size.shape !== undefined) {
+            return genTensor(ctx, size.shape, source, dtype);
+        }
+
+        return ctx.parseSize(size, source).flatMap((ctx) => {
+            const shape = ctx.retVal;
+            if (typeof shape === 'string') {
+                return ctx.warnTensorWithMsg(`from 'LibCall.torch.sizedTensor': ${shape}`, source);
+            }
+            return genTensor(ctx, shape, source, dtype);
+        });
+    }
+
     export function identityShape(
         ctx: Context<LCBase.ExplicitParams>,
         source: CodeSource | undefined
@@ -152,7 +197,49 @@ export namespace TorchLCImpl {
 
         const inputShape = inputSize.shape;
 
-        return genTensor(ctx, inputShape, source);
+        return genTensor(ctx, inputShape, source, fetchDtype(ctx, inputAddr));
+    }
+
+    // identityShape(input) with its dtype set and copied to `out`, without two more round-trips.
+    export function identityShapeWithOut(
+        ctx: Context<LCBase.ExplicitParams>,
+        source: CodeSource | undefined
+    ): ContextSet<ShValue> {
+        const params = ctx.retVal.params;
+        if (params.length !== 3) {
+            return ctx.warnTensorWithMsg(
+                `from 'LibCall.torch.identityShapeWithOut': got insufficient number of argument: ${params.length}`,
+                source
+            );
+        }
+
+        const heap = ctx.heap;
+        const [inputAddr, out, dtype] = params;
+
+        const inputSize = fetchSize(inputAddr, heap);
+
+        if (typeof inputSize === 'string') {
+            return ctx.warnTensorWithMsg(`from 'LibCall.torch.identityShapeWithOut': ${inputSize}`, source);
+        }
+
+        const tensorSet = genTensor(ctx, inputSize.shape, source, dtype.type === SVType.None ? undefined : dtype);
+        if (out.type === SVType.None) {
+            return tensorSet;
+        }
+
+        if (out.type !== SVType.Addr) {
+            return ctx
+                .warnWithMsg(
+                    `from 'LibCall.torch.identityShapeWithOut': out is not an address - got ${out.type}`,
+                    source
+                )
+                .toSet();
+        }
+
+        return tensorSet.map((ctx) => {
+            const tensor = fetchAddr(ctx.retVal, ctx.heap);
+            return tensor ? ctx.setHeap(ctx.heap.setVal(out, tensor)) : ctx;
+        });
     }
 
     export function sameShape(
@@ -498,6 +585,7 @@ export namespace TorchLCImpl {
 
         const heap = ctx.heap;
         const [selfAddr, sizes] = params;
+        const dtype = fetchDtype(ctx, selfAddr);
 
         const selfSize = fetchSize(selfAddr, heap);
         const repeatSizes = fetchAddr(sizes, heap);
@@ -566,7 +654,7 @@ export namespace TorchLCImpl {
                             shape = ExpShape.setDim(shape, targetAxis, newDim, source);
                         }
 
-                        return genTensor(ctx, shape, source);
+                        return genTensor(ctx, shape, source, dtype);
                     } else {
                         // if rank of self is not inferable, we have no choice but to make symbolic shape like broadcasting
                         // that is right-aligned to self.shape and sizes, all the dimensions is gte than sizes
@@ -589,7 +677,7 @@ export namespace TorchLCImpl {
                                 );
                             }
 
-                            return genTensor(newCtx, symShape, source);
+                            return genTensor(newCtx, symShape, source, dtype);
                         });
                     }
                 });
@@ -608,6 +696,7 @@ export namespace TorchLCImpl {
 
         const heap = ctx.heap;
         const [selfAddr, sizeAddr] = params;
+        const dtype = fetchDtype(ctx, selfAddr);
 
         const selfSize = fetchSize(selfAddr, heap);
         const expandSizes = fetchAddr(sizeAddr, heap);
@@ -661,7 +750,7 @@ export namespace TorchLCImpl {
                     );
                 }
 
-                return ctxSet.flatMap((ctx) => genTensor(ctx, modSize, source));
+                return ctxSet.flatMap((ctx) => genTensor(ctx, modSize, source, dtype));
             });
     }
 
@@ -679,6 +768,7 @@ export namespace TorchLCImpl {
 
         const heap = ctx.heap;
         const [selfAddr, sizeAddr] = params;
+        const dtype = fetchDtype(ctx, selfAddr);
 
         const selfSize = fetchSize(selfAddr, heap);
         const expandSize = fetchSize(sizeAddr, heap);
@@ -722,7 +812,7 @@ export namespace TorchLCImpl {
                         );
                     }
 
-                    return ctxSet.flatMap((ctx) => genTensor(ctx, expandShape, source));
+                    return ctxSet.flatMap((ctx) => genTensor(ctx, expandShape, source, dtype));
                 } else {
                     const idx = ctx.genSymInt('expandIdx', source);
                     const i = ExpNum.fromSymbol(idx);
@@ -745,7 +835,7 @@ export namespace TorchLCImpl {
                             `from 'LibCall.torch.expand_as': expanded size must match the existing size at non-singleton dimension ${i.toString()}`,
                             source
                         )
-                        .flatMap((ctx) => genTensor(ctx, expandShape, source));
+                        .flatMap((ctx) => genTensor(ctx, expandShape, source, dtype));
                 }
             });
     }
@@ -796,6 +886,7 @@ export namespace TorchLCImpl {
 
         const heap = ctx.heap;
         const [selfAddr, dim0Addr, dim1Addr] = params;
+        const dtype = fetchDtype(ctx, selfAddr);
 
         const selfSize = fetchSize(selfAddr, heap);
 
@@ -840,7 +931,8 @@ export namespace TorchLCImpl {
                     ExpShape.setDim(selfShape, dim0.value, ExpNum.index(selfShape, dim1.value, source), source),
                     dim1.value,
                     ExpNum.index(selfShape, dim0.value, source),
-                    source
+                    source,
+                    dtype
                 ),
                 source
             )
@@ -853,7 +945,8 @@ export namespace TorchLCImpl {
                     ExpShape.setDim(selfShape, dim0.value, ExpNum.index(selfShape, ndim1, source), source),
                     ndim1,
                     ExpNum.index(selfShape, dim0.value, source),
-                    source
+                    source,
+                    dtype
                 ),
                 source
             );
@@ -866,7 +959,8 @@ export namespace TorchLCImpl {
                     ExpShape.setDim(selfShape, ndim0, ExpNum.index(selfShape, dim1.value, source), source),
                     dim1.value,
                     ExpNum.index(selfShape, ndim0, source),
-                    source
+                    source,
+                    dtype
                 ),
                 source
             );
@@ -880,7 +974,8 @@ export namespace TorchLCImpl {
                     ExpShape.setDim(selfShape, ndim0, ExpNum.index(selfShape, ndim1, source), source),
                     ndim1,
                     ExpNum.index(selfShape, ndim0, source),
-                    source
+                    source,
+                    dtype
                 ),
                 source
             );
@@ -990,6 +1085,7 @@ export namespace TorchLCImpl {
 
         const heap = ctx.heap;
         const [inputAddr, kAddr, dimAddr] = params;
+        const dtype = fetchDtype(ctx, inputAddr);
 
         const inputSize = fetchSize(inputAddr, heap);
         if (typeof inputSize === 'string') {
@@ -1020,7 +1116,7 @@ export namespace TorchLCImpl {
                 `from 'LibCall.torch.topk': k must be within 'dim'-th dimension of input`,
                 source
             )
-            .flatMap((ctx) => genTensor(ctx, ExpShape.setDim(inputShape, dim.value, k.value, source), source));
+            .flatMap((ctx) => genTensor(ctx, ExpShape.setDim(inputShape, dim.value, k.value, source), source, dtype));
     }
 
     // TODO: currently, assumed -1 is given only via constant rank tuple.
@@ -1035,6 +1131,7 @@ export namespace TorchLCImpl {
 
         const heap = ctx.heap;
         const [selfAddr, shapeAddr] = params;
+        const dtype = fetchDtype(ctx, selfAddr);
 
         const selfSize = fetchSize(selfAddr, heap);
         if (typeof selfSize === 'string') {
@@ -1118,7 +1215,7 @@ export namespace TorchLCImpl {
                             // path0: shape argument is [-1]
                             const pathLL = rightZeroPath.flatMap((ctx) => {
                                 const newShape = ExpShape.fromConst(1, [selfNumel], source);
-                                return genTensor(ctx, newShape, source);
+                                return genTensor(ctx, newShape, source, dtype);
                             });
                             // path1: shape argument is [-1, ...]
                             const pathLR = rightNonzeroPath.flatMap((ctx) => {
@@ -1132,7 +1229,7 @@ export namespace TorchLCImpl {
                                         `from 'LibCall.torch.view': numel mismatch. selfSize: ${selfNumel} must be dividable by ${numelR}`,
                                         source
                                     )
-                                    .flatMap((ctx) => genTensor(ctx, newShape, source));
+                                    .flatMap((ctx) => genTensor(ctx, newShape, source, dtype));
                             });
                             return pathLL.join(pathLR);
                         });
@@ -1150,7 +1247,7 @@ export namespace TorchLCImpl {
                                         `from 'LibCall.torch.view': numel mismatch. selfSize: ${selfNumel} must be dividable by ${numelL}`,
                                         source
                                     )
-                                    .flatMap((ctx) => genTensor(ctx, newShape, source));
+                                    .flatMap((ctx) => genTensor(ctx, newShape, source, dtype));
                             });
                             // path3: shape argument is [..., -1, ...]
                             const pathRR = rightNonzeroPath.flatMap((ctx) => {
@@ -1166,7 +1263,7 @@ export namespace TorchLCImpl {
                                         `from 'LibCall.torch.view': numel mismatch. selfSize: ${selfNumel} must be dividable by ${numelLR}`,
                                         source
                                     )
-                                    .flatMap((ctx) => genTensor(ctx, newShape, source));
+                                    .flatMap((ctx) => genTensor(ctx, newShape, source, dtype));
                             });
                             return pathRL.join(pathRR);
                         });
@@ -1194,7 +1291,7 @@ export namespace TorchLCImpl {
                 `from 'LibCall.torch.view': numel mismatch`,
                 source
             )
-            .flatMap((ctx) => genTensor(ctx, shape, source));
+            .flatMap((ctx) => genTensor(ctx, shape, source, dtype));
     }
 
     export function conv2d(ctx: Context<LCBase.ExplicitParams>, source: CodeSource | undefined): ContextSet<ShValue> {
@@ -2152,6 +2249,7 @@ export namespace TorchLCImpl {
 
         const heap = ctx.heap;
         const [inputAddr, dimAddr] = params;
+        const dtype = fetchDtype(ctx, inputAddr);
 
         const inputSize = fetchSize(inputAddr, heap);
         const dim = fetchAddr(dimAddr, heap);
@@ -2179,7 +2277,7 @@ export namespace TorchLCImpl {
                 `from 'LibCall.torch.unsqueeze': dim must be within rank`,
                 source
             )
-            .flatMap((ctx) => genTensor(ctx, returnShape, source));
+            .flatMap((ctx) => genTensor(ctx, returnShape, source, dtype));
     }
 
     export function squeeze(ctx: Context<LCBase.ExplicitParams>, source: CodeSource | undefined): ContextSet<ShValue> {
@@ -2193,6 +2291,7 @@ export namespace TorchLCImpl {
 
         const heap = ctx.heap;
         const [inputAddr, dimAddr] = params;
+        const dtype = fetchDtype(ctx, inputAddr);
 
         const inputSize = fetchSize(inputAddr, heap);
         const dim = fetchAddr(dimAddr, heap);
@@ -2240,7 +2339,7 @@ export namespace TorchLCImpl {
                     source
                 )
                 .flatMap((ctx) => {
-                    return genTensor(ctx, ExpShape.fromConst(outShapes.length, outShapes, source), source);
+                    return genTensor(ctx, ExpShape.fromConst(outShapes.length, outShapes, source), source, dtype);
                 });
         } else {
             const index = simplifyNum(ctx.ctrSet, ExpNum.index(inputShape, dim.value, source));
@@ -2254,9 +2353,9 @@ export namespace TorchLCImpl {
                     source
                 );
                 const newShape = simplifyShape(ctx.ctrSet, ExpShape.concat(left, right, source));
-                return genTensor(ctx, newShape, source);
+                return genTensor(ctx, newShape, source, dtype);
             } else if (dimRng?.gt(1)) {
-                return genTensor(ctx, inputShape, source);
+                return genTensor(ctx, inputShape, source, dtype);
             }
 
             return ctx
@@ -2266,7 +2365,7 @@ export namespace TorchLCImpl {
                     source
                 )
                 .flatMap((ctx) => {
-                    return genTensor(ctx, inputShape, source);
+                    return genTensor(ctx, inputShape, source, dtype);
                 });
         }
     }
@@ -2282,6 +2381,7 @@ export namespace TorchLCImpl {
 
         const heap = ctx.heap;
         const [inputAddr, diagonalAddr] = params;
+        const dtype = fetchDtype(ctx, inputAddr);
 
         const inputSize = fetchSize(inputAddr, heap);
         const diagonal = fetchAddr(diagonalAddr, heap);
@@ -2312,7 +2412,7 @@ export namespace TorchLCImpl {
                     const newDim = ExpNum.bop(NumBopType.Add, dim0, diagAbs, source);
                     const returnShape = ExpShape.fromConst(2, [newDim, newDim], source);
 
-                    return genTensor(ctx, returnShape, source);
+                    return genTensor(ctx, returnShape, source, dtype);
                 });
 
                 const rightPath = rankTwoPath.flatMap((ctx) => {
@@ -2332,7 +2432,7 @@ export namespace TorchLCImpl {
                             source
                         )
                         .flatMap((ctx) => {
-                            return genTensor(ctx, returnShape, source);
+                            return genTensor(ctx, returnShape, source, dtype);
                         });
                 });
 
@@ -2351,6 +2451,7 @@ export namespace TorchLCImpl {
 
         const heap = ctx.heap;
         const [inputAddr, startDimAddr, endDimAddr] = params;
+        const dtype = fetchDtype(ctx, inputAddr);
 
         // TODO: use kwargs info.
         // TODO: handle negative indexing
@@ -2405,7 +2506,7 @@ export namespace TorchLCImpl {
                 `from 'LibCall.torch.flatten': start_dim, end_dim range error`,
                 source
             )
-            .flatMap((ctx) => genTensor(ctx, returnShape, source));
+            .flatMap((ctx) => genTensor(ctx, returnShape, source, dtype));
     }
 
     export function pixel_shuffle(
@@ -2894,11 +2995,19 @@ export namespace TorchLCImpl {
         }
     }
 
+    // dtype of a tensor, kept by operations that only rearrange its shape.
+    function fetchDtype(ctx: Context<unknown>, tensorAddr: ShValue): ShValue | undefined {
+        const tensor = fetchAddr(tensorAddr, ctx.heap);
+        return tensor?.type === SVType.Object ? tensor.getAttr('dtype') : undefined;
+    }
+
     export const libCallImpls: { [key: string]: LCImpl } = {
         tensorInit,
         scalarTensor,
+        sizedTensor,
         callTensor,
         identityShape,
+        identityShapeWithOut,
         sameShape,
         copyOut,
         broadcast,
@@ -75,6 +75,8 @@ class LocalLogger:
 class PyTeaServer:
     def __init__(self, port):
         self.port = port
+        # 5 seconds timeout. build the wrapper once instead of per constraint set.
+        self._with_timeout = timeout(5)
         self.httpd = HTTPServer(("127.0.0.1", port), gen_handler(self.handler))
 
         print(f"python server listening port {port}...")
@@ -94,13 +96,13 @@ class PyTeaServer:
         return json.dumps(respond_rpc(message_id, result)).encode("utf-8")
 
     def analyze(self, obj_list):
-        ctrset_list = list(map(CtrSet, obj_list))
+        with_timeout = self._with_timeout
         result = []
 
-        for ctr_set in ctrset_list:
-            # 5 seconds timeout
+        for obj in obj_list:
+            ctr_set = CtrSet(obj)
             result_obj = dict()
-            analyze_tm = timeout(5)(ctr_set.analysis)
+            analyze_tm = with_timeout(ctr_set.analysis)
             try:
                 (
                     path_result,